@@ -10,7 +10,8 @@ from typing import List, Optional
 from . import __version__
 from .models import Package, DependencyNode
 from .parsers import FileParser
-from .graph_builder import DependencyGraphBuilder
+from .api_client import DEFAULT_CACHE_DIR, DEFAULT_CACHE_TTL
+from .graph_builder import DEFAULT_FETCH_WORKERS, DependencyGraphBuilder
 from .formatters import OutputFormatter
 from .commands.compare import compare_sboms
 from .commands.stats import show_stats
@@ -116,6 +117,13 @@ def handle_create(args):
 
     # Check if we should use existing dependencies or rebuild
     use_existing_deps = args.use_existing_deps
+
+    # Optional on-disk cache of deps.dev responses (enrich/print build their own Namespace)
+    cache_dir = getattr(args, 'cache_dir', None)
+    if cache_dir is None and getattr(args, 'cache', False):
+        cache_dir = str(DEFAULT_CACHE_DIR)
+    cache_ttl = getattr(args, 'cache_ttl', DEFAULT_CACHE_TTL // 3600) * 3600
+    fetch_workers = getattr(args, 'parallel_fetches', DEFAULT_FETCH_WORKERS)
     dependency_trees: List[DependencyNode]
     all_tracked_packages: List[Package]
 
@@ -131,9 +139,10 @@ def handle_create(args):
         logger.info("Packages not in runtime list will be marked as optional")
 
         # Track input package names (without versions - just system:name)
-        input_package_keys = {f"{pkg.system}:{pkg.name}" for pkg in packages}
+        input_package_keys = {pkg.base_key for pkg in packages}
 
-        with DependencyGraphBuilder() as graph_builder:
+        with DependencyGraphBuilder(cache_dir=cache_dir, fetch_workers=fetch_workers,
+                                    cache_ttl=cache_ttl) as graph_builder:
             # Set resolution strategy
             graph_builder.set_resolution_strategy(resolution_strategy)
 
@@ -155,7 +164,7 @@ def handle_create(args):
                     excluded_from_conflict += 1
                     continue
 
-                pkg_key = f"{pkg.system}:{pkg.name}"
+                pkg_key = pkg.base_key
                 if pkg_key in input_package_keys:
                     pkg.scope = "required"  # Observed at runtime
                     pkg.scope_reason = "observed-at-runtime"
@@ -173,7 +182,8 @@ def handle_create(args):
         # Build dependency trees from scratch (for POM, requirements.txt, etc)
         logger.info(f"Analyzing dependencies for {len(packages)} packages...")
 
-        with DependencyGraphBuilder() as graph_builder:
+        with DependencyGraphBuilder(cache_dir=cache_dir, fetch_workers=fetch_workers,
+                                    cache_ttl=cache_ttl) as graph_builder:
             # Apply dependency management if available
             if dependency_management:
                 graph_builder.set_dependency_management(dependency_management)
@@ -199,6 +209,8 @@ def handle_create(args):
         logger.info(f"Using {len(all_tracked_packages)} reconciled packages for output")
 
     # Generate output based on format
+    output: Optional[str] = None
+    sbom_document: Optional[dict] = None  # built SBOM to stream to output_file
     try:
         if args.output_format == 'list':
             output = OutputFormatter.format_as_list(all_tracked_packages)
@@ -216,6 +228,12 @@ def handle_create(args):
                 output = OutputFormatter.enhance_sbom_with_dependencies(
                     original_sbom_content, all_tracked_packages, dependency_trees
                 )
+            elif output_file != '-':
+                # Streamed to the file below instead of building the whole SBOM string in memory.
+                # The document is built first so a generation error never truncates an existing file.
+                sbom_document = OutputFormatter.build_sbom(
+                    all_tracked_packages, dependency_trees, command_line, project_metadata
+                )
             else:
                 output = OutputFormatter.format_as_sbom(all_tracked_packages, dependency_trees, command_line, project_metadata)
     except Exception as e:
@@ -225,7 +243,12 @@ def handle_create(args):
 
     # Write output
     try:
-        if output_file == '-':
+        if sbom_document is not None:
+            with open(output_file, 'w') as f:
+                OutputFormatter.dump_sbom(f, sbom_document)
+            logger.info(f"Output written to: {output_file}")
+            print(f"Output written to: {output_file}")
+        elif output_file == '-':
             print(output, end='')
         else:
             with open(output_file, 'w') as f:
@@ -368,7 +391,7 @@ def parse_dependency_graph_from_sbom(sbom_content: str, packages: List[Package])
         for root_ref in root_refs:
             pkg = bomref_to_package.get(root_ref)
             if pkg:
-                root_node = build_dependency_node(root_ref, dep_graph, bomref_to_package, ref_to_node, 0)
+                root_node = build_dependency_node(root_ref, dep_graph, bomref_to_package, ref_to_node)
                 if root_node:
                     trees.append(root_node)
             else:
@@ -379,7 +402,7 @@ def parse_dependency_graph_from_sbom(sbom_content: str, packages: List[Package])
                 for child_ref in child_refs:
                     child_pkg = bomref_to_package.get(child_ref)
                     if child_pkg:
-                        child_node = build_dependency_node(child_ref, dep_graph, bomref_to_package, ref_to_node, 0)
+                        child_node = build_dependency_node(child_ref, dep_graph, bomref_to_package, ref_to_node)
                         if child_node:
                             trees.append(child_node)
 
@@ -390,8 +413,8 @@ def parse_dependency_graph_from_sbom(sbom_content: str, packages: List[Package])
         return []
 
 
-def build_dependency_node(ref, dep_graph, bomref_to_package, ref_to_node, depth):
-    """Recursively build DependencyNode from SBOM dependency graph."""
+def build_dependency_node(ref, dep_graph, bomref_to_package, ref_to_node):
+    """Build DependencyNode from SBOM dependency graph (iterative depth-first walk)."""
     # Check if already built (handle cycles)
     if ref in ref_to_node:
         return ref_to_node[ref]
@@ -400,21 +423,47 @@ def build_dependency_node(ref, dep_graph, bomref_to_package, ref_to_node, depth)
     if not pkg:
         return None
 
-    node = DependencyNode(package=pkg, depth=depth)
-    ref_to_node[ref] = node
-
-    # Add children
-    child_refs = dep_graph.get(ref, [])
-    for child_ref in child_refs:
-        child_node = build_dependency_node(child_ref, dep_graph, bomref_to_package, ref_to_node, depth + 1)
-        if child_node:
+    root = DependencyNode(package=pkg)
+    ref_to_node[ref] = root
+
+    # Each frame is a node still adding children, with an iterator over its remaining child refs
+    stack = [(root, iter(dep_graph.get(ref, [])))]
+    while stack:
+        node, child_refs = stack[-1]
+        for child_ref in child_refs:
+            child_node = ref_to_node.get(child_ref)
+            if child_node is not None:
+                node.add_child(child_node)
+                continue
+
+            child_pkg = bomref_to_package.get(child_ref)
+            if not child_pkg:
+                continue
+
+            child_node = DependencyNode(package=child_pkg)
+            ref_to_node[child_ref] = child_node
             node.add_child(child_node)
+            stack.append((child_node, iter(dep_graph.get(child_ref, []))))
+            break
+        else:
+            stack.pop()
 
-    return node
+    return root
 
 
-def main():
-    """Main entry point."""
+def _positive_int(value: str) -> int:
+    """argparse type for options that need a count of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser with all subcommands."""
     parser = argparse.ArgumentParser(
         prog='deptrast',
         description='The ultimate dependency tree converter, enhancer, and streamliner'
@@ -446,6 +495,14 @@ def main():
                                help='Project name for tree output')
     create_parser.add_argument('--use-existing-deps', action='store_true',
                                help='Use existing dependency graph from SBOM (fast mode)')
+    create_parser.add_argument('--cache', action='store_true',
+                               help=f'Cache deps.dev responses on disk in {DEFAULT_CACHE_DIR}')
+    create_parser.add_argument('--cache-dir', default=None, metavar='DIR',
+                               help='Cache deps.dev responses on disk in DIR (implies --cache)')
+    create_parser.add_argument('--cache-ttl', type=_positive_int, default=DEFAULT_CACHE_TTL // 3600, metavar='HOURS',
+                               help=f'Refetch disk-cached responses older than HOURS. Default: {DEFAULT_CACHE_TTL // 3600}')
+    create_parser.add_argument('--parallel-fetches', type=_positive_int, default=DEFAULT_FETCH_WORKERS, metavar='N',
+                               help=f'Maximum concurrent deps.dev requests. Default: {DEFAULT_FETCH_WORKERS}')
     create_parser.add_argument('-v', '--verbose', action='store_true',
                                help='Verbose output')
     create_parser.add_argument('--loglevel',
@@ -509,7 +566,12 @@ def main():
     validate_parser.add_argument('--loglevel', choices=['TRACE', 'DEBUG', 'INFO', 'WARN', 'ERROR'])
     validate_parser.set_defaults(func=handle_validate)
 
-    # Parse arguments
+    return parser
+
+
+def main():
+    """Main entry point."""
+    parser = build_parser()
     args = parser.parse_args()
 
     if not args.command:
@@ -1,28 +1,85 @@
 """Client for interacting with the deps.dev API."""
 
+import json
 import logging
-from typing import Optional, Dict, Any
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
 from urllib.parse import quote
 
+import requests
+from urllib3.util.retry import Retry
+
 from .models import Package
 from .version_parser import VersionParser
 from .ssl_config import create_session
 
 logger = logging.getLogger(__name__)
 
+# Default location for the on-disk deps.dev response cache
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "deptrast" / "depsdev"
+
+# How long a disk-cached response is served before it is fetched again (seconds).
+# deps.dev resolves version ranges, so a graph for the same version can change over time.
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
 
 class DepsDevClient:
     """Client for fetching dependency information from deps.dev API."""
 
     BASE_URL = "https://api.deps.dev/v3/systems"
 
-    def __init__(self):
-        """Initialize the API client."""
-        self.session = create_session()
+    # Keep-alive connections to deps.dev; raised to the worker count for larger pools
+    MAX_CONNECTIONS = 32
+
+    # Transient failures (throttling, server errors, dropped connections) are retried
+    # with exponential backoff (0.5s, 1s, 2s), honouring Retry-After on 429/503
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_FACTOR = 0.5
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_workers: int = 1,
+        cache_ttl: Optional[float] = DEFAULT_CACHE_TTL
+    ):
+        """
+        Initialize the API client.
+
+        Args:
+            cache_dir: Optional directory for caching deps.dev responses on disk
+                       across runs. Responses are always cached in memory for the
+                       lifetime of the client.
+            max_workers: Largest number of threads that will fetch concurrently;
+                         the connection pool is sized to hold one connection each.
+            cache_ttl: Age in seconds after which a disk-cached response is fetched
+                       again, or None to keep cached responses forever.
+        """
+        # One session for the client's lifetime so TCP/TLS connections are reused
+        self.session = create_session(
+            pool_maxsize=max(self.MAX_CONNECTIONS, max_workers),
+            max_retries=Retry(
+                total=self.MAX_RETRIES,
+                backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                status_forcelist=self.RETRY_STATUS_CODES,
+                respect_retry_after_header=True,
+                raise_on_status=False,  # hand back the last response so it is logged below
+            ),
+        )
         self.session.headers.update({
             "Accept": "application/json",
             "User-Agent": "deptrast/3.0.1"
         })
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.cache_ttl = cache_ttl
+
+        # (system, name, deps.dev version) -> response (None for unknown packages)
+        self._cache: Dict[Tuple[str, str, str], Optional[Dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
 
     def get_dependency_graph(self, package: Package) -> Optional[Dict[str, Any]]:
         """
@@ -41,6 +98,20 @@ class DepsDevClient:
         # Parse version to handle vendor-specific formats (e.g., HeroDevs)
         depsdev_version = VersionParser.get_depsdev_version(package.version)
 
+        # Serve repeats within a run from memory, and recent responses from the disk cache
+        cache_key = (package.system, package.name, depsdev_version)
+        with self._cache_lock:
+            if cache_key in self._cache:
+                logger.debug(f"Using cached dependency graph for {package.full_name}")
+                return self._cache[cache_key]
+
+        graph = self._read_disk_cache(cache_key)
+        if graph is not None:
+            logger.debug(f"Using disk-cached dependency graph for {package.full_name}")
+            with self._cache_lock:
+                self._cache[cache_key] = graph
+            return graph
+
         # URL-encode the package name to handle special characters like ':'
         encoded_name = quote(package.name, safe='')
         url = (
@@ -57,17 +128,114 @@ class DepsDevClient:
         try:
             response = self.session.get(url, timeout=30)
             if response.status_code == 200:
-                return response.json()
+                graph = response.json()
+                with self._cache_lock:
+                    self._cache[cache_key] = graph
+                self._write_disk_cache(cache_key, graph)
+                return graph
             else:
                 logger.info(
                     f"Failed to get dependency graph for {package.full_name}: "
                     f"HTTP {response.status_code}"
                 )
+                if response.status_code == 404:
+                    # Unknown to deps.dev - remember that for this run only
+                    with self._cache_lock:
+                        self._cache[cache_key] = None
                 return None
         except requests.RequestException as e:
             logger.error(f"Error fetching dependencies for {package.full_name}: {e}")
             return None
 
+    def iter_dependency_graphs(
+        self, packages: List[Package], max_workers: int = 1, return_exceptions: bool = False
+    ) -> Iterator[Tuple[Package, Optional[Dict[str, Any]]]]:
+        """
+        Yield (package, response) pairs in input order while later requests are in flight.
+
+        All distinct packages are submitted up front, so the caller can process each
+        response as soon as it (and everything before it) has arrived, overlapping its
+        own work with the remaining network round trips.
+
+        Args:
+            packages: Packages to fetch dependency graphs for
+            max_workers: Maximum number of requests in flight at once
+            return_exceptions: Yield an exception raised while fetching a package in
+                               place of its response instead of ending the iteration
+
+        Yields:
+            (package, response or None) for each package, in the same order as packages
+        """
+        unique: Dict[str, Package] = {}
+        for pkg in packages:
+            unique.setdefault(pkg.full_name, pkg)
+        to_fetch = list(unique.values())
+
+        fetch = self._get_dependency_graph_or_exception if return_exceptions else self.get_dependency_graph
+
+        if len(to_fetch) <= 1 or max_workers <= 1:
+            yield from self._pair_in_order(packages, map(fetch, to_fetch))
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(to_fetch))) as executor:
+            yield from self._pair_in_order(packages, executor.map(fetch, to_fetch))
+
+    def _get_dependency_graph_or_exception(self, package: Package) -> Any:
+        """get_dependency_graph() that returns, rather than raises, any exception."""
+        try:
+            return self.get_dependency_graph(package)
+        except Exception as e:
+            return e
+
+    @staticmethod
+    def _pair_in_order(
+        packages: List[Package], results: Iterable[Optional[Dict[str, Any]]]
+    ) -> Iterator[Tuple[Package, Optional[Dict[str, Any]]]]:
+        """Match results for the distinct packages (first-seen order) back up with every package."""
+        results = iter(results)
+        graphs: Dict[str, Optional[Dict[str, Any]]] = {}
+        for pkg in packages:
+            if pkg.full_name not in graphs:
+                graphs[pkg.full_name] = next(results)
+            yield pkg, graphs[pkg.full_name]
+
+    def _disk_cache_path(self, cache_key: Tuple[str, str, str]) -> Optional[Path]:
+        """Return the cache file for a (system, name, version) key, or None if disabled."""
+        if not self.cache_dir:
+            return None
+        system, name, version = cache_key
+        return self.cache_dir / system / quote(name, safe='') / f"{quote(version, safe='')}.json"
+
+    def _read_disk_cache(self, cache_key: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+        """Load a cached response from disk, or None if missing, expired or unreadable."""
+        path = self._disk_cache_path(cache_key)
+        if not path or not path.is_file():
+            return None
+        try:
+            if self.cache_ttl is not None and time.time() - path.stat().st_mtime > self.cache_ttl:
+                logger.debug(f"Cache file {path} is older than {self.cache_ttl}s, refetching")
+                return None
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache file {path}: {e}")
+            return None
+
+    def _write_disk_cache(self, cache_key: Tuple[str, str, str], graph: Dict[str, Any]) -> None:
+        """Store a response on disk (best effort - failures are only logged)."""
+        path = self._disk_cache_path(cache_key)
+        if not path:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so concurrent runs never see partial files
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(graph, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write cache file {path}: {e}")
+
     def close(self):
         """Close the session and clean up resources."""
         self.session.close()
@@ -4,7 +4,7 @@ import json
 import logging
 import re
 from datetime import datetime
-from typing import List, Collection, Dict, Optional
+from typing import List, Collection, Dict, Optional, TextIO
 from uuid import uuid4
 
 from packageurl import PackageURL
@@ -19,6 +19,29 @@ from .models import Package, DependencyNode
 
 logger = logging.getLogger(__name__)
 
+# JSON separators matching the Java output (no space after comma, spaces around colon)
+_JAVA_SEPARATORS = (',', ' : ')
+
+# Maven scope -> CycloneDX component scope
+_SCOPE_MAP = {
+    'compile': ComponentScope.REQUIRED,
+    'runtime': ComponentScope.REQUIRED,
+    'required': ComponentScope.REQUIRED,
+    'optional': ComponentScope.OPTIONAL,
+    'test': ComponentScope.EXCLUDED,
+    'provided': ComponentScope.EXCLUDED,
+    'system': ComponentScope.EXCLUDED,
+    'excluded': ComponentScope.EXCLUDED,
+}
+
+# Field order of SBOM components and tool components, matching the Java output
+_COMPONENT_FIELD_ORDER = (
+    'type', 'bom-ref', 'group', 'name', 'version', 'scope', 'purl', 'properties', 'tags'
+)
+_TOOL_COMPONENT_FIELD_ORDER = (
+    'type', 'bom-ref', 'authors', 'publisher', 'group', 'name', 'version', 'purl', 'externalReferences'
+)
+
 
 class OutputFormatter:
     """Formatter for various output formats."""
@@ -35,7 +58,12 @@ class OutputFormatter:
         all_packages: Collection[Package],
         project_name: str = 'project'
     ) -> str:
-        """Format as a tree visualization."""
+        """
+        Format as a tree visualization.
+
+        Every subtree is printed once: a package reached again is marked "(shared, see above)",
+        or "(cycle)" when it depends on itself through the current path.
+        """
         lines = ["Dependency Tree:", ""]
 
         # Create a project root node
@@ -72,37 +100,57 @@ class OutputFormatter:
 
     @staticmethod
     def _format_maven_node(node: DependencyNode, prefix: str, is_last: bool, depth: int = 0, visited: set = None) -> List[str]:
-        """Format a single node in Maven tree style."""
+        """
+        Format a node and its subtree in Maven tree style (iterative pre-order walk).
+
+        Like DependencyNode.get_tree_representation, a node already on the current path is
+        marked "(cycle)" and one printed earlier is marked "(shared, see above)"; neither is
+        expanded again. visited collects every printed name and may be shared across trees.
+        """
         if visited is None:
             visited = set()
 
         lines = []
+        on_path = set()
+        # Entries are (node, prefix, is_last, depth); a bare name marks leaving that node's subtree
+        stack = [(node, prefix, is_last, depth)]
+
+        while stack:
+            entry = stack.pop()
+            if isinstance(entry, str):
+                on_path.discard(entry)
+                continue
 
-        # Check for cycles
-        node_id = node.package.full_name
-        if node_id in visited:
-            # Just show the node without recursing
+            node, prefix, is_last, depth = entry
+            node_id = node.full_name
+
+            # Check for cycles, then for subtrees already printed
+            if node_id in on_path:
+                marker = " (cycle)"
+            elif node_id in visited:
+                marker = " (shared, see above)"
+            else:
+                marker = ""
+
+            # Connector
             if depth > 0:
                 connector = "\\- " if is_last else "+- "
-                lines.append(f"[INFO] {prefix}{connector}{node_id} (cycle)")
+                lines.append(f"[INFO] {prefix}{connector}{node_id}{marker}")
             else:
-                lines.append(f"[INFO] +- {node_id} (cycle)")
-            return lines
-
-        visited.add(node_id)
+                lines.append(f"[INFO] +- {node_id}{marker}")
 
-        # Connector
-        if depth > 0:
-            connector = "\\- " if is_last else "+- "
-            lines.append(f"[INFO] {prefix}{connector}{node.package.full_name}")
-        else:
-            lines.append(f"[INFO] +- {node.package.full_name}")
+            if marker:
+                continue
+            visited.add(node_id)
+            on_path.add(node_id)
+            stack.append(node_id)
 
-        # Children
-        for i, child in enumerate(node.children):
-            is_last_child = (i == len(node.children) - 1)
+            # Children, pushed last-first so they are emitted in order
+            children = node.children
             child_prefix = prefix + ("   " if is_last else "|  ")
-            lines.extend(OutputFormatter._format_maven_node(child, child_prefix, is_last_child, depth + 1, visited))
+            last_index = len(children) - 1
+            for i in range(last_index, -1, -1):
+                stack.append((children[i], child_prefix, i == last_index, depth + 1))
 
         return lines
 
@@ -114,6 +162,49 @@ class OutputFormatter:
         project_metadata: Optional[Dict[str, str]] = None
     ) -> str:
         """Generate a CycloneDX SBOM in JSON format."""
+        ordered_sbom = OutputFormatter.build_sbom(
+            packages, dependency_trees, command_line, project_metadata
+        )
+
+        # Use separators to match Java (no trailing space after comma, space before and after colon)
+        sbom_json = json.dumps(ordered_sbom, indent=2, separators=_JAVA_SEPARATORS)
+
+        # Replace empty arrays [] with [ ] to match Java formatting
+        sbom_json = sbom_json.replace('[]', '[ ]')
+
+        return sbom_json
+
+    @staticmethod
+    def dump_sbom(fp: TextIO, ordered_sbom: Dict, java_compat: bool = True) -> None:
+        """
+        Stream an SBOM document from build_sbom() to an open text file as JSON.
+
+        Writes the encoded JSON chunk by chunk instead of building the whole document
+        as one string first, which keeps peak memory down for large SBOMs. With
+        java_compat (the default) the output is identical to format_as_sbom();
+        without it, standard JSON formatting is used.
+        """
+        if not java_compat:
+            json.dump(ordered_sbom, fp, indent=2)
+            return
+
+        encoder = json.JSONEncoder(indent=2, separators=_JAVA_SEPARATORS)
+        for chunk in encoder.iterencode(ordered_sbom):
+            # Empty arrays are always encoded as their own '[]' chunk
+            fp.write(chunk.replace('[]', '[ ]'))
+
+    @staticmethod
+    def build_sbom(
+        packages: Collection[Package],
+        dependency_trees: List[DependencyNode],
+        command_line: str = None,
+        project_metadata: Optional[Dict[str, str]] = None
+    ) -> Dict:
+        """
+        Build the SBOM as a dict with fields ordered to match the Java output.
+
+        Pair with dump_sbom() to finish generating before an output file is opened.
+        """
         from . import __version__
 
         bom = Bom()
@@ -185,6 +276,9 @@ class OutputFormatter:
         # Build dependency map from tree structure
         dependency_map = OutputFormatter._build_dependency_map(dependency_trees)
 
+        # Hash-based membership for the dependency filters below (packages is often a list)
+        package_set = packages if isinstance(packages, (set, frozenset)) else set(packages)
+
         # Add all packages as components
         for pkg in packages:
             component = OutputFormatter._package_to_component(pkg)
@@ -203,7 +297,7 @@ class OutputFormatter:
             root_deps = []
             for tree in dependency_trees:
                 root_purl = OutputFormatter._build_purl(tree.package)
-                if tree.package in packages:
+                if tree.package in package_set:
                     root_dep_ref = BomRef(root_purl)
                     root_deps.append(Dependency(ref=root_dep_ref))
 
@@ -223,9 +317,13 @@ class OutputFormatter:
         for pkg in packages:
             purl = OutputFormatter._build_purl(pkg)
 
-            # Get direct dependencies
-            direct_deps = dependency_map.get(pkg, [])
-            depends_on = [OutputFormatter._build_purl(dep) for dep in direct_deps if dep in packages]
+            # Get direct dependencies that are part of this SBOM
+            direct_deps = dependency_map.get(pkg)
+            if direct_deps:
+                valid_deps = package_set.intersection(direct_deps)
+                depends_on = [OutputFormatter._build_purl(dep) for dep in valid_deps]
+            else:
+                depends_on = []
 
             # Always include dependsOn (even if empty) to match Java
             # Sort dependsOn array for consistent ordering
@@ -247,7 +345,7 @@ class OutputFormatter:
             root_deps = []
             for tree in dependency_trees:
                 root_purl = OutputFormatter._build_purl(tree.package)
-                if tree.package in packages:  # Only include if it's in our package list
+                if tree.package in package_set:  # Only include if it's in our package list
                     root_deps.append(root_purl)
 
             # Sort root dependencies for consistency
@@ -267,22 +365,10 @@ class OutputFormatter:
         sbom['dependencies'] = dependencies
 
         # Reorder component fields to match Java output: type, bom-ref, group, name, version, scope, purl, properties, tags
-        reordered_components = []
-        for comp in sbom.get('components', []):
-            ordered_comp = {
-                'type': comp.get('type'),
-                'bom-ref': comp.get('bom-ref'),
-                'group': comp.get('group'),
-                'name': comp.get('name'),
-                'version': comp.get('version'),
-                'scope': comp.get('scope'),
-                'purl': comp.get('purl'),
-                'properties': comp.get('properties'),
-                'tags': comp.get('tags')
-            }
-            # Remove None values
-            ordered_comp = {k: v for k, v in ordered_comp.items() if v is not None}
-            reordered_components.append(ordered_comp)
+        reordered_components = [
+            OutputFormatter._reorder_fields(comp, _COMPONENT_FIELD_ORDER)
+            for comp in sbom.get('components', [])
+        ]
 
         # Sort components alphabetically by purl for consistent ordering
         reordered_components.sort(key=lambda c: c.get('purl', ''))
@@ -290,23 +376,10 @@ class OutputFormatter:
         # Reorder metadata.tools.components fields to match Java
         metadata = sbom.get('metadata', {})
         if 'tools' in metadata and 'components' in metadata['tools']:
-            reordered_tool_comps = []
-            for tool_comp in metadata['tools']['components']:
-                ordered_tool = {
-                    'type': tool_comp.get('type'),
-                    'bom-ref': tool_comp.get('bom-ref'),
-                    'authors': tool_comp.get('authors'),
-                    'publisher': tool_comp.get('publisher'),
-                    'group': tool_comp.get('group'),
-                    'name': tool_comp.get('name'),
-                    'version': tool_comp.get('version'),
-                    'purl': tool_comp.get('purl'),
-                    'externalReferences': tool_comp.get('externalReferences')
-                }
-                # Remove None values
-                ordered_tool = {k: v for k, v in ordered_tool.items() if v is not None}
-                reordered_tool_comps.append(ordered_tool)
-            metadata['tools']['components'] = reordered_tool_comps
+            metadata['tools']['components'] = [
+                OutputFormatter._reorder_fields(tool_comp, _TOOL_COMPONENT_FIELD_ORDER)
+                for tool_comp in metadata['tools']['components']
+            ]
 
         # Add commandLine property if provided
         if command_line:
@@ -349,13 +422,17 @@ class OutputFormatter:
             'dependencies': sbom.get('dependencies')
         }
 
-        # Use separators to match Java (no trailing space after comma, space before and after colon)
-        sbom_json = json.dumps(ordered_sbom, indent=2, separators=(',', ' : '))
+        return ordered_sbom
 
-        # Replace empty arrays [] with [ ] to match Java formatting
-        sbom_json = sbom_json.replace('[]', '[ ]')
-
-        return sbom_json
+    @staticmethod
+    def _reorder_fields(entry: Dict, field_order: tuple) -> Dict:
+        """Copy the given fields of a JSON object in order, skipping missing/None values."""
+        ordered = {}
+        for field_name in field_order:
+            value = entry.get(field_name)
+            if value is not None:
+                ordered[field_name] = value
+        return ordered
 
     @staticmethod
     def enhance_sbom_with_dependencies(
@@ -370,7 +447,11 @@ class OutputFormatter:
         # Build dependency map from tree structure
         dependency_map = OutputFormatter._build_dependency_map(dependency_trees)
 
-        # Build purl lookup maps
+        # Build purl lookup maps (first package wins for a given purl)
+        package_by_purl: Dict[str, Package] = {}
+        for pkg in packages:
+            package_by_purl.setdefault(pkg.purl, pkg)
+
         purl_by_package: Dict[Package, str] = {}
         bomref_by_package: Dict[Package, str] = {}
 
@@ -381,18 +462,16 @@ class OutputFormatter:
                 continue
 
             # Find matching package
-            for pkg in packages:
-                expected_purl = OutputFormatter._build_purl(pkg)
-                if purl == expected_purl:
-                    purl_by_package[pkg] = purl
-
-                    # Get or create bom-ref
-                    bomref = component.get('bom-ref')
-                    if not bomref:
-                        bomref = purl
-                        component['bom-ref'] = bomref
-                    bomref_by_package[pkg] = bomref
-                    break
+            pkg = package_by_purl.get(purl)
+            if pkg is not None:
+                purl_by_package[pkg] = purl
+
+                # Get or create bom-ref
+                bomref = component.get('bom-ref')
+                if not bomref:
+                    bomref = purl
+                    component['bom-ref'] = bomref
+                bomref_by_package[pkg] = bomref
 
         # Build dependencies array
         dependencies = []
@@ -439,36 +518,44 @@ class OutputFormatter:
         dependency_map: Dict[Package, List[Package]],
         visited: set
     ) -> None:
-        """Recursively collect dependency relationships from tree."""
-        if not node:
-            return
+        """
+        Collect dependency relationships from tree.
 
-        # Check for cycles
-        node_id = node.package.full_name
-        if node_id in visited:
+        Walks the graph with an explicit stack (pre-order, same visiting order as a
+        recursive walk) so large graphs don't pay per-node call overhead or hit the
+        recursion limit.
+        """
+        if not node:
             return
-        visited.add(node_id)
-
-        pkg = node.package
-        children = [child.package for child in node.children]
 
-        # Deduplicate children list (defensive - shouldn't be needed but handles edge cases)
-        seen = set()
-        unique_children = []
-        for child in children:
-            child_key = child.full_name
-            if child_key not in seen:
-                seen.add(child_key)
-                unique_children.append(child)
+        stack = [node]
+        while stack:
+            current = stack.pop()
 
-        # Only overwrite if we don't already have a better entry
-        # (one with children beats one without)
-        if pkg not in dependency_map or len(unique_children) > 0:
-            dependency_map[pkg] = unique_children
-
-        # Recurse into children
-        for child in node.children:
-            OutputFormatter._collect_dependencies_from_tree(child, dependency_map, visited)
+            # Check for cycles
+            node_id = current.full_name
+            if node_id in visited:
+                continue
+            visited.add(node_id)
+
+            # Deduplicate children (defensive - shouldn't be needed but handles edge cases)
+            seen = set()
+            unique_children = []
+            for child in current.children:
+                child_pkg = child.package
+                child_key = child_pkg.full_name
+                if child_key not in seen:
+                    seen.add(child_key)
+                    unique_children.append(child_pkg)
+
+            # Only overwrite if we don't already have a better entry
+            # (one with children beats one without)
+            pkg = current.package
+            if unique_children or pkg not in dependency_map:
+                dependency_map[pkg] = unique_children
+
+            # Push children in reverse so they are visited in their original order
+            stack.extend(reversed(current.children))
 
     @staticmethod
     def _maven_scope_to_cyclonedx(maven_scope: str) -> ComponentScope:
@@ -481,19 +568,10 @@ class OutputFormatter:
           optional -> OPTIONAL (optional at runtime)
         """
         if not maven_scope:
-            maven_scope = "compile"  # Default Maven scope
-
-        scope_lower = maven_scope.lower()
+            return ComponentScope.REQUIRED  # Default Maven scope (compile)
 
-        if scope_lower == "optional":
-            return ComponentScope.OPTIONAL
-        elif scope_lower in ("test", "provided", "system", "excluded"):
-            return ComponentScope.EXCLUDED
-        elif scope_lower in ("compile", "runtime", "required"):
-            return ComponentScope.REQUIRED
-        else:
-            # Default to REQUIRED for unknown scopes
-            return ComponentScope.REQUIRED
+        # Default to REQUIRED for unknown scopes
+        return _SCOPE_MAP.get(maven_scope.lower(), ComponentScope.REQUIRED)
 
     @staticmethod
     def _package_to_component(pkg: Package) -> Component:
@@ -501,7 +579,8 @@ class OutputFormatter:
         # For Maven packages, separate group and artifact
         name = pkg.name
         group = None
-        if pkg.system.lower() == 'maven' and ':' in pkg.name:
+        # Package normalizes system to lowercase on construction
+        if pkg.system == 'maven' and ':' in pkg.name:
             parts = pkg.name.split(':', 1)
             group = parts[0]
             name = parts[1]
@@ -582,12 +661,7 @@ class OutputFormatter:
     @staticmethod
     def _build_purl(pkg: Package) -> str:
         """Build a Package URL (purl) string for a package."""
-        if pkg.system.lower() == 'maven':
-            # Convert groupId:artifactId to groupId/artifactId
-            name = pkg.name.replace(':', '/')
-            return f"pkg:maven/{name}@{pkg.version}"
-        else:
-            return f"pkg:{pkg.system.lower()}/{pkg.name}@{pkg.version}"
+        return pkg.purl
 
     @staticmethod
     def _get_language_from_purl_type(purl_type: str) -> str:
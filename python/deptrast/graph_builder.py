@@ -1,15 +1,58 @@
 """Builds dependency graphs from package lists using a two-phase approach."""
 
 import logging
-from typing import List, Dict, Set, Optional, Collection, Tuple
+import re
+from functools import lru_cache
+from typing import Any, Iterator, List, Dict, Set, Optional, Collection, FrozenSet, Tuple
 from collections import defaultdict, deque
 
 from .models import Package, DependencyNode
-from .api_client import DepsDevClient
+from .api_client import DEFAULT_CACHE_TTL, DepsDevClient
 from .version_parser import VersionParser
 
 logger = logging.getLogger(__name__)
 
+# Max number of deps.dev requests in flight at once
+DEFAULT_FETCH_WORKERS = 8
+
+_VERSION_SEPARATORS = re.compile(r'[.\-]')
+
+# Shared empty defaults for parent_map / exclusions lookups (avoids allocating a set per miss)
+_NO_PARENTS: frozenset = frozenset()
+_NO_EXCLUSIONS: frozenset = frozenset()
+
+# Reachability bits used by scope propagation
+_REQUIRED_REACHABLE = 1
+_TEST_REACHABLE = 2
+
+
+@lru_cache(maxsize=None)
+def _version_parts(version: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Split a version into (part, numeric value or None) pairs. Cached - the set of versions is small."""
+    parts = []
+    for part in _VERSION_SEPARATORS.split(version):
+        try:
+            parts.append((part, int(part)))
+        except ValueError:
+            parts.append((part, None))
+    return tuple(parts)
+
+
+@lru_cache(maxsize=65536)
+def _compare_version_strings(v1: str, v2: str) -> int:
+    """Compare two versions part by part (numeric when both parts are integers). Cached per pair."""
+    parts1 = _version_parts(v1)
+    parts2 = _version_parts(v2)
+
+    for (part1, num1), (part2, num2) in zip(parts1, parts2):
+        if num1 is not None and num2 is not None:
+            if num1 != num2:
+                return num1 - num2
+        elif part1 != part2:
+            return 1 if part1 > part2 else -1
+
+    return len(parts1) - len(parts2)
+
 
 class DependencyGraphBuilder:
     """
@@ -26,13 +69,26 @@ class DependencyGraphBuilder:
     - This "delinks" parts of the tree not selected by resolution
     """
 
-    def __init__(self):
-        """Initialize the graph builder."""
-        self.api_client = DepsDevClient()
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        fetch_workers: int = DEFAULT_FETCH_WORKERS,
+        cache_ttl: Optional[float] = DEFAULT_CACHE_TTL
+    ):
+        """
+        Initialize the graph builder.
+
+        Args:
+            cache_dir: Optional directory for caching deps.dev responses across runs
+            fetch_workers: Maximum number of concurrent deps.dev requests
+            cache_ttl: Age in seconds after which a disk-cached response is fetched again
+        """
+        self.api_client = DepsDevClient(cache_dir=cache_dir, max_workers=fetch_workers, cache_ttl=cache_ttl)
 
         # Phase 1: Raw graph data from deps.dev
         self.all_packages: Dict[str, Package] = {}  # pkg_name -> Package
         self.all_nodes: Dict[str, DependencyNode] = {}  # pkg_name -> Node (one per version)
+        self.nodes_by_base_key: Dict[str, List[DependencyNode]] = defaultdict(list)  # base_key -> Nodes (all versions)
         self.raw_graphs: Dict[str, DependencyNode] = {}  # pkg_name -> root node of fetched graph
         self.parent_map: Dict[str, Set[str]] = defaultdict(set)  # child_pkg_name -> Set[parent_pkg_names]
 
@@ -41,8 +97,10 @@ class DependencyGraphBuilder:
 
         # Configuration
         self.dependency_management: Dict[str, str] = {}  # name -> version
+        self._name_to_system: Dict[str, str] = {}  # name -> system (for managed packages)
         self.exclusions: Dict[str, Set[str]] = {}  # parent_name -> Set[excluded_names]
         self.resolution_strategy: str = "highest"  # maven or highest
+        self.fetch_workers: int = fetch_workers  # concurrent deps.dev requests
 
     def _create_package(self, system: str, name: str, version: str) -> Package:
         """
@@ -94,7 +152,8 @@ class DependencyGraphBuilder:
         """
         logger.info(f"Building dependency trees for {len(input_packages)} packages")
 
-        input_package_names = {pkg.full_name for pkg in input_packages}
+        # Read-only from here on (checked once per node during root detection)
+        input_package_names = frozenset(pkg.full_name for pkg in input_packages)
 
         # PHASE 1: Build raw dependency graph from deps.dev
         logger.info("PHASE 1: Building raw dependency graph from deps.dev")
@@ -112,13 +171,7 @@ class DependencyGraphBuilder:
         logger.info("PHASE 2: SKIPPED - no reconciliation, all versions included")
 
         # STEP 3: Find which INPUT packages appear as dependencies in OTHER input packages' trees
-        input_packages_appearing_as_children = set()
-        for tree_root_name, tree in self.raw_graphs.items():
-            self._find_input_packages_in_tree(
-                tree, input_package_names,
-                input_packages_appearing_as_children,
-                tree_root_name, set()
-            )
+        input_packages_appearing_as_children = self._find_input_packages_in_other_trees(input_package_names)
 
         # STEP 4: Roots = input packages that DON'T appear as children
         root_package_names = input_package_names - input_packages_appearing_as_children
@@ -139,13 +192,6 @@ class DependencyGraphBuilder:
         logger.info(f"Total unique package versions: {len(self.all_nodes)}")
         return root_nodes
 
-    def _get_base_key(self, pkg: Package) -> str:
-        """
-        Get base key for a package (system:name without version).
-        Used for grouping different versions of the same library.
-        """
-        return f"{pkg.system.lower()}:{pkg.name}"
-
     def _apply_managed_version_overrides(self) -> None:
         """
         Apply dependency management overrides by fetching correct versions and replacing wrong nodes.
@@ -161,41 +207,55 @@ class DependencyGraphBuilder:
 
         nodes_to_replace = {}  # wrong_full_name -> correct_full_name
 
-        # Find all nodes that need to be replaced
-        for full_name, node in list(self.all_nodes.items()):
+        # Skip building per-node log messages unless they will be emitted
+        debug = logger.isEnabledFor(logging.DEBUG)
+        info = logger.isEnabledFor(logging.INFO)
+
+        # Find all nodes that need to be replaced (read-only pass - fetching happens below)
+        for full_name, node in self.all_nodes.items():
             pkg = node.package
-            base_key = self._get_base_key(pkg)
+            base_key = pkg.base_key
             managed_version = self.dependency_management.get(base_key)
 
             if managed_version and managed_version != pkg.version:
-                correct_full_name = f"{pkg.system.lower()}:{pkg.name}:{managed_version}"
+                correct_full_name = f"{base_key}:{managed_version}"
                 nodes_to_replace[full_name] = correct_full_name
-                logger.info(f"Need to replace {full_name} with managed version {correct_full_name}")
+                if info:
+                    logger.info(f"Need to replace {full_name} with managed version {correct_full_name}")
 
         if not nodes_to_replace:
             logger.info("No version overrides needed")
             return
 
-        # Fetch the correct versions
+        # Collect the correct versions we don't have yet
+        correct_pkgs: List[Package] = []
+        pending: Set[str] = set()
         for wrong_full_name, correct_full_name in nodes_to_replace.items():
-            # Skip if we already have the correct version
+            # Skip if we already have (or are about to fetch) the correct version
             if correct_full_name in self.all_nodes:
-                logger.debug(f"Correct version {correct_full_name} already exists")
+                if debug:
+                    logger.debug(f"Correct version {correct_full_name} already exists")
                 continue
-
-            # Parse the correct version info
-            parts = correct_full_name.split(':')
-            if len(parts) != 3:
-                logger.warning(f"Invalid fullName format: {correct_full_name}")
+            if correct_full_name in pending:
                 continue
 
-            system, name, version = parts
-            correct_pkg = self._create_package(system, name, version)
+            # Same library as the wrong version (Maven names contain ':' so the full name is not re-split)
+            wrong_pkg = self.all_nodes[wrong_full_name].package
+            managed_version = self.dependency_management[wrong_pkg.base_key]
+            correct_pkgs.append(self._create_package(wrong_pkg.system, wrong_pkg.name, managed_version))
+            pending.add(correct_full_name)
 
-            logger.info(f"Fetching managed version: {correct_full_name}")
+        # Fetch the correct versions concurrently, parsing them in order on this thread as they arrive
+        logger.info(f"Fetching {len(correct_pkgs)} managed versions")
+        for correct_pkg, graph in self._iter_dependency_graphs(correct_pkgs, return_exceptions=True):
+            correct_full_name = correct_pkg.full_name
+
+            if isinstance(graph, Exception):
+                logger.warning(f"Error fetching managed version {correct_full_name}: {graph}")
+                continue
 
             try:
-                correct_tree = self._fetch_raw_dependency_graph(correct_pkg)
+                correct_tree = self._process_raw_dependency_graph(correct_pkg, graph)
                 if correct_tree:
                     logger.info(f"Successfully fetched managed version {correct_full_name}")
                 else:
@@ -214,23 +274,23 @@ class DependencyGraphBuilder:
             # Mark wrong version as excluded due to dependency management override
             wrong_pkg = wrong_node.package
             correct_pkg = correct_node.package
-            parts = correct_full_name.split(':')
-            managed_version = parts[2] if len(parts) == 3 else "unknown"
+            managed_version = correct_pkg.version
 
             wrong_pkg.scope = "excluded"
             wrong_pkg.scope_reason = "override-loser"
             wrong_pkg.winning_version = managed_version
 
             # Track defeated version on the winner and mark as override winner
-            if wrong_pkg.version not in correct_pkg.defeated_versions:
-                correct_pkg.defeated_versions.append(wrong_pkg.version)
+            correct_pkg.add_defeated_version(wrong_pkg.version)
             correct_pkg.is_override_winner = True
 
-            logger.info(f"Marked {wrong_full_name} as excluded (dependency management override, winner: {managed_version})")
+            if info:
+                logger.info(f"Marked {wrong_full_name} as excluded (dependency management override, winner: {managed_version})")
 
             # DON'T disconnect override losers - keep them in the graph alongside winners
             # The visualization will show both the overridden version and the managed version
-            logger.debug(f"Keeping both {wrong_full_name} (override loser) and {correct_full_name} (override winner) in graph")
+            if debug:
+                logger.debug(f"Keeping both {wrong_full_name} (override loser) and {correct_full_name} (override winner) in graph")
 
         logger.info(f"Applied {len(nodes_to_replace)} managed version overrides")
 
@@ -260,25 +320,30 @@ class DependencyGraphBuilder:
 
         logger.info(f"Determined {len(winning_versions)} winning versions")
 
+        # Skip building per-node log messages unless they will be emitted
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         # Step 2: Identify all losers (non-winning versions)
         losers: Set[str] = set()
         conflicts_found = 0
 
         for node_name, node in self.all_nodes.items():
             pkg = node.package
-            base_key = self._get_base_key(pkg)
+            base_key = pkg.base_key
             winning_version = winning_versions.get(base_key)
 
             # Skip nodes already excluded by dependency management override (Phase 1.5)
             # Those nodes should keep their original edges only, not get winner edges added
             if pkg.scope == "excluded":
-                logger.debug(f"Skipping {node_name} - already excluded by dependency management")
+                if debug:
+                    logger.debug(f"Skipping {node_name} - already excluded by dependency management")
                 continue
 
             if winning_version and pkg.version != winning_version:
                 losers.add(node_name)
                 conflicts_found += 1
-                logger.debug(f"Loser identified: {node_name} (winner: {base_key}:{winning_version})")
+                if debug:
+                    logger.debug(f"Loser identified: {node_name} (winner: {base_key}:{winning_version})")
 
         logger.info(f"Found {conflicts_found} losing versions out of {len(self.all_nodes)} total nodes")
 
@@ -287,7 +352,7 @@ class DependencyGraphBuilder:
         for loser_name in losers:
             loser_node = self.all_nodes[loser_name]
             loser_pkg = loser_node.package
-            base_key = self._get_base_key(loser_pkg)
+            base_key = loser_pkg.base_key
 
             if base_key not in defeated_versions_by_base_key:
                 defeated_versions_by_base_key[base_key] = []
@@ -303,7 +368,7 @@ class DependencyGraphBuilder:
             loser_pkg = loser_node.package
 
             # Find the winning version for this loser
-            base_key = self._get_base_key(loser_pkg)
+            base_key = loser_pkg.base_key
             winning_version = winning_versions.get(base_key)
 
             # Set the strategy on the loser
@@ -314,12 +379,14 @@ class DependencyGraphBuilder:
                 loser_pkg.scope = 'excluded'
                 loser_pkg.scope_reason = 'loser'
                 loser_pkg.winning_version = winning_version
-                logger.debug(f"Marked as excluded: {loser_name} (winner: {winning_version})")
+                if debug:
+                    logger.debug(f"Marked as excluded: {loser_name} (winner: {winning_version})")
             else:
                 # Already marked (e.g., by dependency management), just ensure scope is excluded
                 loser_pkg.scope = 'excluded'
                 loser_pkg.winning_version = winning_version
-                logger.debug(f"Already marked as excluded: {loser_name} (reason: {loser_pkg.scope_reason}, winner: {winning_version})")
+                if debug:
+                    logger.debug(f"Already marked as excluded: {loser_name} (reason: {loser_pkg.scope_reason}, winner: {winning_version})")
 
         # Step 6: Mark winners with defeated versions
         for base_key, winning_version in winning_versions.items():
@@ -334,9 +401,9 @@ class DependencyGraphBuilder:
                     winner_pkg = winner_node.package
                     winner_pkg.scope_strategy = self.resolution_strategy  # Set strategy on winner too
                     for defeated_version in defeated:
-                        if defeated_version not in winner_pkg.defeated_versions:
-                            winner_pkg.defeated_versions.append(defeated_version)
-                    logger.debug(f"Winner {winner_full_name} defeated versions: {defeated}")
+                        winner_pkg.add_defeated_version(defeated_version)
+                    if debug:
+                        logger.debug(f"Winner {winner_full_name} defeated versions: {defeated}")
 
         # Step 5: Mark loser subtrees as excluded (unless other incoming links)
         excluded_subtree_count = self._mark_loser_subtrees_excluded(losers)
@@ -381,18 +448,26 @@ class DependencyGraphBuilder:
             name = f"{group_id}:{artifact_id}"
             full_name = f"maven:{name}:{version}"
 
-            # Only add if not already in input packages
-            if full_name not in input_package_names:
-                managed_pkg = self._create_package('maven', name, version)
-                packages_to_fetch.append(managed_pkg)
-                self.all_packages[full_name] = managed_pkg
-                logger.info(f"Adding managed dependency version to fetch list: {full_name}")
+            # Only add if not already an input package or already fetched into the graph
+            if full_name in input_package_names or full_name in self.all_nodes:
+                logger.debug(f"Managed dependency version already present: {full_name}")
+                continue
+
+            managed_pkg = self._create_package('maven', name, version)
+            packages_to_fetch.append(managed_pkg)
+            self.all_packages[managed_pkg.full_name] = managed_pkg
+            logger.info(f"Adding managed dependency version to fetch list: {full_name}")
 
-        for pkg in packages_to_fetch:
+        # Fetch graphs from deps.dev concurrently (each returns the COMPLETE transitive tree!),
+        # parsing each in order on this thread while later fetches are still in flight -
+        # parsing mutates all_nodes/all_packages, so it never runs on the worker threads
+        for pkg, graph in self._iter_dependency_graphs(packages_to_fetch):
             pkg_name = pkg.full_name
 
-            # Fetch graph from deps.dev (this returns the COMPLETE transitive tree!)
-            root_node = self._fetch_raw_dependency_graph(pkg)
+            # A repeated input shares the first copy's graph - it would parse to the same nodes
+            root_node = self.raw_graphs.get(pkg_name)
+            if root_node is None:
+                root_node = self._process_raw_dependency_graph(pkg, graph)
             if root_node:
                 self.raw_graphs[pkg_name] = root_node
                 logger.debug(f"Successfully fetched graph for {pkg_name}")
@@ -404,13 +479,29 @@ class DependencyGraphBuilder:
         logger.info(f"Phase 1 complete: Fetched {len(self.raw_graphs)} graphs, "
                    f"total {len(self.all_nodes)} unique package versions")
 
-    def _fetch_raw_dependency_graph(self, package: Package) -> Optional[DependencyNode]:
+    def _iter_dependency_graphs(
+        self, packages: List[Package], return_exceptions: bool = False
+    ) -> Iterator[Tuple[Package, Optional[Dict[str, Any]]]]:
         """
-        Fetch raw dependency graph from deps.dev for a package.
-        Returns root node with ALL edges as returned by API (no filtering).
+        Fetch deps.dev dependency graphs for several packages concurrently.
+
+        The work is network-bound, so the client overlaps the round trips on a small
+        thread pool. Only the HTTP calls run on worker threads; (package, graph) pairs
+        are yielded in the same order as packages so callers can parse them
+        deterministically while the remaining requests complete. With return_exceptions,
+        a failed fetch yields its exception instead of ending the iteration.
         """
-        graph = self.api_client.get_dependency_graph(package)
+        return self.api_client.iter_dependency_graphs(
+            packages, max_workers=self.fetch_workers, return_exceptions=return_exceptions
+        )
 
+    def _process_raw_dependency_graph(
+        self, package: Package, graph: Optional[Dict[str, Any]]
+    ) -> Optional[DependencyNode]:
+        """
+        Add a fetched deps.dev graph (or a leaf node if the fetch failed) to the raw graph.
+        Returns root node with ALL edges as returned by API (no filtering).
+        """
         if not graph:
             logger.info(f"Unknown component {package.full_name}. Treating as leaf node.")
 
@@ -420,14 +511,21 @@ class DependencyGraphBuilder:
                 return self.all_nodes[package.full_name]
 
             # Create leaf node and add to all_nodes
-            node = DependencyNode(package=package)
-            self.all_nodes[package.full_name] = node
+            node = self._register_node(package)
             self.all_packages[package.full_name] = package
             logger.debug(f"Created and registered leaf node for {package.full_name}")
             return node
 
         return self._parse_dependency_graph(graph, package)
 
+    def _register_node(self, package: Package) -> DependencyNode:
+        """Create the node for a package version and index it by full name and base key."""
+        node = DependencyNode(package=package)
+        node.index = len(self.all_nodes)  # dense id: position in all_nodes (which only grows)
+        self.all_nodes[package.full_name] = node
+        self.nodes_by_base_key[package.base_key].append(node)
+        return node
+
     def _parse_dependency_graph(self, graph: Dict, root_package: Package) -> Optional[DependencyNode]:
         """
         Parse dependency graph from deps.dev response.
@@ -450,6 +548,12 @@ class DependencyGraphBuilder:
         node_map: Dict[int, DependencyNode] = {}
         self_node_index = -1
 
+        # Local aliases for the per-node loop (one lookup each instead of one per node)
+        all_packages = self.all_packages
+        all_nodes = self.all_nodes
+        dependency_management = self.dependency_management
+        name_to_system = self._name_to_system
+
         for i, node in enumerate(nodes):
             version_key = node.get("versionKey", {})
             system = version_key.get("system", "")
@@ -457,36 +561,39 @@ class DependencyGraphBuilder:
             version = version_key.get("version", "")
             relation = node.get("relation", "")
 
-            # Create or reuse package
+            # Create or reuse package (a new entry is keyed by its own full_name, so keys are shared)
             full_name = f"{system.lower()}:{name}:{version}"
-            if full_name not in self.all_packages:
-                self.all_packages[full_name] = self._create_package(system, name, version)
-            pkg = self.all_packages[full_name]
+            pkg = all_packages.get(full_name)
+            if pkg is None:
+                pkg = self._create_package(system, name, version)
+                all_packages[pkg.full_name] = pkg
 
             # Track name -> system mapping for dependency management lookup
-            if name in self.dependency_management and name not in self._name_to_system:
-                self._name_to_system[name] = system.lower()
+            if name in dependency_management and name not in name_to_system:
+                name_to_system[name] = system.lower()
 
             # Create or reuse node
-            if full_name not in self.all_nodes:
-                self.all_nodes[full_name] = DependencyNode(package=pkg)
-            node_map[i] = self.all_nodes[full_name]
+            graph_node = all_nodes.get(full_name)
+            if graph_node is None:
+                graph_node = self._register_node(pkg)
+            node_map[i] = graph_node
 
             if relation == "SELF":
                 self_node_index = i
 
-        # Build adjacency from edges
-        adjacency: Dict[int, List[int]] = defaultdict(list)
+        # Build adjacency from edges: one child-index list per response node, indexed directly
+        node_count = len(nodes)
+        adjacency: List[List[int]] = [[] for _ in range(node_count)]
         for edge in edges:
             from_node = edge.get("fromNode")
             to_node = edge.get("toNode")
-            if from_node is not None and to_node is not None:
+            if from_node is not None and to_node is not None and 0 <= from_node < node_count:
                 adjacency[from_node].append(to_node)
 
         # Build graph from SELF node
         # Note: _build_graph_from_adjacency will only add children if the node doesn't already have them
         if self_node_index != -1:
-            self._build_graph_from_adjacency(node_map, adjacency, self_node_index, set())
+            self._build_graph_from_adjacency(node_map, adjacency, self_node_index)
             packages_added = len(self.all_packages) - packages_before
             logger.debug(f"Parsed graph for {root_package.full_name}: {len(nodes)} nodes in response, {packages_added} new packages added to all_packages")
             return node_map[self_node_index]
@@ -496,46 +603,55 @@ class DependencyGraphBuilder:
     def _build_graph_from_adjacency(
         self,
         node_map: Dict[int, DependencyNode],
-        adjacency: Dict[int, List[int]],
-        current_index: int,
-        visited: Set[int]
+        adjacency: List[List[int]],
+        start_index: int
     ) -> None:
         """
         Build graph structure from adjacency list.
         ALWAYS populate children from this graph - merge all edges.
+
+        Breadth-first walk from start_index with one shared visited set, so each
+        node's edges are processed once (O(V+E)). Edges are handled per node in
+        adjacency order, so children lists come out the same for any walk order.
         """
-        if current_index in visited:
-            return
-        visited.add(current_index)
+        visited: Set[int] = {start_index}
+        queue = deque([start_index])
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        current_node = node_map.get(current_index)
-        if not current_node:
-            return
+        while queue:
+            current_index = queue.popleft()
 
-        # Get parent exclusions
-        parent_pkg = current_node.package
-        parent_exclusions = self.exclusions.get(parent_pkg.name, set())
+            current_node = node_map.get(current_index)
+            if not current_node:
+                continue
 
-        # Add all children from this graph
-        children = adjacency.get(current_index, [])
-        for child_index in children:
-            child_node = node_map[child_index]
-            child_pkg = child_node.package
+            # Get parent exclusions
+            parent_pkg = current_node.package
+            parent_name = current_node.full_name
+            parent_exclusions = self.exclusions.get(parent_pkg.name, _NO_EXCLUSIONS)
 
-            # Check if this child is excluded by the parent
-            if self._is_excluded(child_pkg, parent_exclusions):
-                logger.debug(f"Excluding dependency {child_pkg.name} from parent {parent_pkg.name}")
-                continue  # Skip this child
+            # Add all children from this graph
+            for child_index in adjacency[current_index]:
+                child_node = node_map[child_index]
+                child_pkg = child_node.package
 
-            # Add child if not already present
-            if child_node not in current_node.children:
+                # Check if this child is excluded by the parent
+                if parent_exclusions and child_pkg.name in parent_exclusions:
+                    if debug:
+                        logger.debug(f"Excluding dependency {child_pkg.name} from parent {parent_pkg.name}")
+                    continue  # Skip this child
+
+                # Add child if not already present
                 current_node.add_child(child_node)
 
-            # Track parent-child relationship
-            self.parent_map[child_node.package.full_name].add(current_node.package.full_name)
+                # Track parent-child relationship (node names are cached strings, so their
+                # hashes are computed once rather than for a freshly formatted key per edge)
+                self.parent_map[child_node.full_name].add(parent_name)
 
-            # Recursively build subtree
-            self._build_graph_from_adjacency(node_map, adjacency, child_index, visited.copy())
+                # Build the child's subtree (once per graph)
+                if child_index not in visited:
+                    visited.add(child_index)
+                    queue.append(child_index)
 
     def _determine_maven_winning_versions(self, roots: List[DependencyNode]) -> Dict[str, str]:
         """
@@ -548,40 +664,51 @@ class DependencyGraphBuilder:
         first_occurrence: Dict[str, Tuple[str, int]] = {}
         queue = deque()
 
+        # Nodes are shared per package version, so node identity is the visited key.
+        # Marking nodes when they are queued (BFS order means that is their nearest depth)
+        # keeps each node in the queue at most once.
+        visited: Set[int] = set()
         for root in roots:
-            queue.append((root, 0))
+            if id(root) not in visited:
+                visited.add(id(root))
+                queue.append((root, 0))
 
-        visited: Set[str] = set()
+        # Skip building per-node log messages unless they will be emitted
+        debug = logger.isEnabledFor(logging.DEBUG)
+        info = logger.isEnabledFor(logging.INFO)
 
         while queue:
             node, depth = queue.popleft()
 
             pkg = node.package
-            base_key = self._get_base_key(pkg)
-            node_id = f"{base_key}:{pkg.version}"
-
-            if node_id in visited:
-                continue
-            visited.add(node_id)
+            base_key = pkg.base_key
 
             # Track first/nearest occurrence
-            if base_key not in first_occurrence:
+            existing = first_occurrence.get(base_key)
+            if existing is None:
                 first_occurrence[base_key] = (pkg.version, depth)
-                logger.debug(f"First occurrence: {base_key} v{pkg.version} at depth {depth}")
+                if debug:
+                    logger.debug(f"First occurrence: {base_key} v{pkg.version} at depth {depth}")
             else:
-                existing_version, existing_depth = first_occurrence[base_key]
+                existing_version, existing_depth = existing
                 if depth < existing_depth:
-                    logger.info(f"Nearer occurrence: {base_key} v{pkg.version} at depth {depth} "
-                              f"replaces v{existing_version} at depth {existing_depth}")
+                    if info:
+                        logger.info(f"Nearer occurrence: {base_key} v{pkg.version} at depth {depth} "
+                                  f"replaces v{existing_version} at depth {existing_depth}")
                     first_occurrence[base_key] = (pkg.version, depth)
                 elif depth == existing_depth and self._compare_versions(pkg.version, existing_version) > 0:
-                    logger.info(f"Tie-breaker: {base_key} at depth {depth}: "
-                              f"v{pkg.version} replaces v{existing_version} (higher)")
+                    if info:
+                        logger.info(f"Tie-breaker: {base_key} at depth {depth}: "
+                                  f"v{pkg.version} replaces v{existing_version} (higher)")
                     first_occurrence[base_key] = (pkg.version, depth)
 
-            # Queue children
+            # Queue children not seen yet
+            child_depth = depth + 1
             for child in node.children:
-                queue.append((child, depth + 1))
+                child_id = id(child)
+                if child_id not in visited:
+                    visited.add(child_id)
+                    queue.append((child, child_depth))
 
         # Return just version map
         return {base_key: version for base_key, (version, _) in first_occurrence.items()}
@@ -612,221 +739,68 @@ class DependencyGraphBuilder:
                 logger.debug(f"Skipping input version for {pkg_name} (not in raw_graphs)")
                 continue
 
-            base_key = f"{pkg.system}:{pkg.name}"
+            base_key = pkg.base_key
             if base_key not in winning_versions:
                 winning_versions[base_key] = pkg.version
                 logger.debug(f"Input version: {base_key} -> {pkg.version}")
 
         # Priority 3: Highest version seen IN FETCHED GRAPHS
         # Only consider versions that actually exist in all_nodes (successfully fetched)
-        for node_name, node in self.all_nodes.items():
-            pkg = node.package
-            base_key = self._get_base_key(pkg)
-
-            if base_key in winning_versions:
-                # Already have a winner from higher priority - check if this is higher
-                if self._compare_versions(pkg.version, winning_versions[base_key]) > 0:
-                    logger.debug(f"Higher version: {base_key} {winning_versions[base_key]} -> {pkg.version}")
-                    winning_versions[base_key] = pkg.version
-            else:
-                # First time seeing this package
-                winning_versions[base_key] = pkg.version
+        # Each library's versions are reduced to a single maximum and written back once.
+        # Topology plays no part in "highest", so no graph traversal is needed here.
+        compare_versions = self._compare_versions
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for base_key, nodes in self.nodes_by_base_key.items():
+            # Start from the higher-priority winner if there is one, else the first version seen
+            best = winning_versions.get(base_key)
+            for node in nodes:
+                version = node.package.version
+                if best is None:
+                    best = version
+                elif version != best and compare_versions(version, best) > 0:
+                    # Higher than the current winner (including managed/input versions)
+                    if debug:
+                        logger.debug(f"Higher version: {base_key} {best} -> {version}")
+                    best = version
+            if best is not None:
+                winning_versions[base_key] = best
 
         return winning_versions
 
-    def _relink_to_winning_versions(self, winning_versions: Dict[str, str]) -> None:
-        """
-        Phase 2: Relink all edges to point to winning version nodes.
-        Simple strategy: iterate through each node's children, if a child needs reconciliation
-        to a different version, fetch that version and replace the child.
+    def _find_input_packages_in_other_trees(self, input_package_names: FrozenSet[str]) -> Set[str]:
         """
-        logger.info("Relinking edges to winning versions")
-
-        relinked_count = 0
-
-        # Visit all nodes and reconcile their children to point to winning versions
-        for node in self.all_nodes.values():
-            new_children = []
-
-            for child in node.children:
-                child_pkg = child.package
-                base_key = f"{child_pkg.system.lower()}:{child_pkg.name}"
-
-                # Check exclusions
-                parent_exclusions = self.exclusions.get(node.package.name, set())
-                if self._is_excluded(child_pkg, parent_exclusions):
-                    logger.debug(f"Excluding {child_pkg.name} from parent {node.package.name}")
-                    continue
-
-                # Get winning version
-                winning_version = winning_versions.get(base_key)
-                if not winning_version:
-                    logger.warning(f"No winning version for {base_key}, keeping current {child_pkg.version}")
-                    new_children.append(child)
-                    continue
+        Find which input packages are reachable from the root of some OTHER fetched graph.
 
-                # If child already points to winning version, keep it
-                if child_pkg.version == winning_version:
-                    new_children.append(child)
-                    continue
-
-                # Need to replace this child with the winning version
-                logger.info(f"Reconciling child {child_pkg.name} from {child_pkg.version} to {winning_version}")
-
-                # Look up the winning version node (should already exist from Phase 1)
-                winning_node_name = f"{child_pkg.system.lower()}:{child_pkg.name}:{winning_version}"
-                winning_node = self.all_nodes.get(winning_node_name)
-
-                if winning_node:
-                    new_children.append(winning_node)
-                    relinked_count += 1
-                else:
-                    logger.warning(f"Winning version {winning_node_name} not found in all_nodes, keeping {child_pkg.version}")
-                    new_children.append(child)
-
-            node.children = new_children
-
-        logger.info(f"Relinked {relinked_count} edges to winning versions")
-
-    def _mark_excluded_nodes(self, replaced_node_names: Set[str]) -> int:
+        Rather than walking every graph separately, one pass pushes the names of the
+        graphs that reach each node down the shared node graph. A node only needs to
+        remember two of them: enough to tell whether any graph other than its own
+        reaches it. Each node is therefore expanded at most twice (O(V + E) overall).
         """
-        Mark replaced nodes as scope='excluded'.
-        Only mark children as excluded if they are ONLY reachable from excluded nodes.
-        Returns count of packages marked as excluded.
-        """
-        # First, find all packages that are reachable from non-replaced (winning) nodes
-        reachable_from_winners = set()
-        for node in self.all_nodes.values():
-            if node.package.full_name not in replaced_node_names:
-                self._collect_reachable_packages(node, reachable_from_winners)
-
-        logger.debug(f"Found {len(reachable_from_winners)} packages reachable from winning versions")
-
-        # Now mark replaced nodes and their children (but skip if reachable from winners)
-        excluded_count = 0
-        visited = set()
-
-        for node_name in replaced_node_names:
-            node = self.all_nodes.get(node_name)
-            if node:
-                excluded_count += self._mark_excluded_recursive(node, visited, reachable_from_winners)
-
-        return excluded_count
-
-    def _collect_reachable_packages(self, node: DependencyNode, reachable: Set[str], visited: Optional[Set[str]] = None) -> None:
-        """Collect all packages reachable from this node."""
-        if visited is None:
-            visited = set()
-
-        if node.package.full_name in visited:
-            return
-
-        visited.add(node.package.full_name)
-        reachable.add(node.package.full_name)
-
-        for child in node.children:
-            self._collect_reachable_packages(child, reachable, visited)
+        result: Set[str] = set()
+        reached_from: Dict[int, Set[str]] = {}  # id(node) -> up to two tree root names
+        queue = deque()
 
-    def _mark_excluded_recursive(self, node: DependencyNode, visited: Set[str], reachable_from_winners: Set[str]) -> int:
-        """
-        Recursively mark a node and its children as scope='excluded'.
-        Skip marking if the package is reachable from winning versions.
-        Returns count of packages marked.
-        """
-        # Prevent infinite loops in case of cycles
-        if node.package.full_name in visited:
-            return 0
+        def reach(node: DependencyNode, tree_root_name: str) -> None:
+            origins = reached_from.setdefault(id(node), set())
+            if len(origins) >= 2 or tree_root_name in origins:
+                return
+            origins.add(tree_root_name)
+            queue.append((node, tree_root_name))
 
-        visited.add(node.package.full_name)
-        count = 0
+            node_name = node.full_name
+            if node_name in input_package_names and node_name != tree_root_name:
+                result.add(node_name)
 
-        # Only mark as excluded if NOT reachable from winning versions
-        if node.package.full_name not in reachable_from_winners:
-            if node.package.scope != 'excluded':
-                logger.debug(f"Marking {node.package.full_name} as excluded (not reachable from winners)")
-                node.package.scope = 'excluded'
-                count = 1
+        for tree_root_name, tree in self.raw_graphs.items():
+            if tree:
+                reach(tree, tree_root_name)
 
-            # Recursively mark children (they'll also check reachability)
+        while queue:
+            node, tree_root_name = queue.popleft()
             for child in node.children:
-                count += self._mark_excluded_recursive(child, visited, reachable_from_winners)
-
-        return count
-
-    def _find_root_nodes(self, input_packages: List[Package], input_package_names: Set[str]) -> List[DependencyNode]:
-        """
-        Find root nodes: input packages that don't appear as dependencies in other trees.
-        """
-        # Find which input packages appear as children
-        input_packages_appearing_as_children: Set[str] = set()
-
-        for root_name, root in self.raw_graphs.items():
-            self._find_input_packages_in_tree(root, input_package_names,
-                                             input_packages_appearing_as_children, root_name, set())
-
-        # Roots are input packages NOT appearing as children
-        root_package_names = input_package_names - input_packages_appearing_as_children
-
-        root_nodes = []
-        for root_name in root_package_names:
-            node = self.all_nodes.get(root_name)
-            if node:
-                node.mark_as_root()
-                root_nodes.append(node)
-
-        return root_nodes
-
-    def _find_input_packages_in_tree(
-        self,
-        node: DependencyNode,
-        input_package_names: Set[str],
-        input_packages_appearing_as_children: Set[str],
-        tree_root_name: str,
-        visited: Set[str]
-    ) -> None:
-        """Recursively find which input packages appear in this tree."""
-        if not node:
-            return
-
-        node_name = node.package.full_name
-
-        # Prevent cycles (relinking can create cycles)
-        if node_name in visited:
-            return
-        visited.add(node_name)
-
-        if node_name in input_package_names and node_name != tree_root_name:
-            input_packages_appearing_as_children.add(node_name)
-
-        for child in node.children:
-            self._find_input_packages_in_tree(child, input_package_names,
-                                            input_packages_appearing_as_children, tree_root_name, visited)
-
-    def _collect_all_package_names(self, node: DependencyNode, package_names: Set[str],
-                                   visited: Optional[Set[str]] = None) -> None:
-        """Recursively collect all package names from a dependency tree."""
-        if not node:
-            return
-
-        if visited is None:
-            visited = set()
-
-        package_name = node.package.full_name
-
-        if package_name in visited:
-            return
-        visited.add(package_name)
-
-        package_names.add(package_name)
-
-        for child in node.children:
-            self._collect_all_package_names(child, package_names, visited)
+                reach(child, tree_root_name)
 
-    def _is_excluded(self, package: Package, parent_exclusions: Set[str]) -> bool:
-        """Check if a package should be excluded."""
-        if not parent_exclusions:
-            return False
-        return package.name in parent_exclusions
+        return result
 
     def _redirect_edges_to_winners(self, losers: Set[str], winning_versions: Dict[str, str]) -> int:
         """
@@ -835,15 +809,21 @@ class DependencyGraphBuilder:
         Returns count of redirected edges.
         """
         redirect_count = 0
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Local aliases for the lookups done per loser and per parent
+        get_node = self.all_nodes.get
+        get_parents = self.parent_map.get
+        parent_map = self.parent_map
 
         for loser_name in losers:
-            loser_node = self.all_nodes.get(loser_name)
+            loser_node = get_node(loser_name)
             if not loser_node:
                 continue
 
             # Get loser's package info
             loser_pkg = loser_node.package
-            base_key = self._get_base_key(loser_pkg)
+            base_key = loser_pkg.base_key
             winning_version = winning_versions.get(base_key)
 
             if not winning_version:
@@ -852,17 +832,17 @@ class DependencyGraphBuilder:
 
             # Find winner node
             winner_name = f"{base_key}:{winning_version}"
-            winner_node = self.all_nodes.get(winner_name)
+            winner_node = get_node(winner_name)
 
             if not winner_node:
                 logger.warning(f"Winner node not found: {winner_name}")
                 continue
 
             # Get all parents of this loser
-            parent_names = self.parent_map.get(loser_name, set())
+            parent_names = get_parents(loser_name, _NO_PARENTS)
 
             for parent_name in parent_names:
-                parent_node = self.all_nodes.get(parent_name)
+                parent_node = get_node(parent_name)
                 if not parent_node:
                     continue
 
@@ -870,17 +850,13 @@ class DependencyGraphBuilder:
                 # IMPORTANT: We do NOT remove the loser from parent.children - we intentionally
                 # keep BOTH the loser and winner so the SBOM shows the full resolution story
                 # (original version + resolved version). The loser will be tagged as scope:excluded.
-                if winner_node not in parent_node.children:
+                if not parent_node.has_child(winner_node):
                     parent_node.add_child(winner_node)
                     # Update parent_map for the winner
-                    self.parent_map[winner_name].add(parent_name)
+                    parent_map[winner_name].add(parent_name)
                     redirect_count += 1
-                    logger.debug(f"Redirected: {parent_name} → {winner_name} (was {loser_name})")
-
-                    # DEBUG: Track commons-io additions to commons-compress
-                    if "commons-compress@1.27.1" in parent_name and "commons-io" in winner_name:
-                        logger.warning(f"DEBUG: Adding {winner_name} to commons-compress@1.27.1 (from loser {loser_name})")
-                        logger.warning(f"DEBUG: commons-compress@1.27.1 children before: {[c.package.full_name for c in parent_node.children]}")
+                    if debug:
+                        logger.debug(f"Redirected: {parent_name} → {winner_name} (was {loser_name})")
 
         return redirect_count
 
@@ -892,29 +868,48 @@ class DependencyGraphBuilder:
         """
         excluded_count = 0
         visited = set()
+        get_node = self.all_nodes.get
 
         for loser_name in losers:
-            loser_node = self.all_nodes.get(loser_name)
+            loser_node = get_node(loser_name)
             if not loser_node:
                 continue
 
-            # Recursively mark children (if they don't have other incoming links)
-            excluded_count += self._mark_subtree_excluded_recursive(
-                loser_node, visited, losers
-            )
+            # Mark children (if they don't have other incoming links)
+            excluded_count += self._mark_subtree_excluded(loser_node, visited, losers)
 
         return excluded_count
 
-    def _mark_subtree_excluded_recursive(
+    def _mark_subtree_excluded(
         self, node: DependencyNode, visited: Set[str], excluded_parents: Set[str]
     ) -> int:
         """
-        Recursively mark children as excluded if ALL their parents are excluded.
+        Mark children as excluded if ALL their parents are excluded, depth-first.
+
+        A parent counts as excluded if it is in excluded_parents or was marked on the
+        current path down from node. The path is tracked in one set that is updated
+        as the walk enters and leaves marked nodes, instead of copying the set for
+        every level.
         """
         count = 0
+        path_excluded: Set[str] = set()  # nodes marked on the current path
+        debug = logger.isEnabledFor(logging.DEBUG)
+        get_parents = self.parent_map.get
+
+        # Each frame: (name of the marked node to leave on exit, iterator over its children)
+        stack = [(None, iter(node.children))]
+
+        while stack:
+            marked_name, children = stack[-1]
+            child = next(children, None)
+
+            if child is None:
+                stack.pop()
+                if marked_name is not None:
+                    path_excluded.discard(marked_name)
+                continue
 
-        for child in node.children:
-            child_name = child.package.full_name
+            child_name = child.full_name
 
             if child_name in visited:
                 continue
@@ -925,9 +920,9 @@ class DependencyGraphBuilder:
                 continue
 
             # Check if child has ANY non-excluded parents
-            child_parents = self.parent_map.get(child_name, set())
+            child_parents = get_parents(child_name, _NO_PARENTS)
             has_non_excluded_parent = any(
-                parent_name not in excluded_parents
+                parent_name not in excluded_parents and parent_name not in path_excluded
                 for parent_name in child_parents
             )
 
@@ -936,12 +931,12 @@ class DependencyGraphBuilder:
                 child.package.scope = 'excluded'
                 child.package.scope_reason = 'conflict-resolution-subtree'
                 count += 1
-                logger.debug(f"Marked subtree node as excluded: {child_name}")
+                if debug:
+                    logger.debug(f"Marked subtree node as excluded: {child_name}")
 
-                # Recursively mark its children
-                # Add this child to excluded_parents for recursive call
-                new_excluded = excluded_parents | {child_name}
-                count += self._mark_subtree_excluded_recursive(child, visited, new_excluded)
+                # Descend into its children with this child counted as an excluded parent
+                path_excluded.add(child_name)
+                stack.append((child_name, iter(child.children)))
 
         return count
 
@@ -949,26 +944,7 @@ class DependencyGraphBuilder:
         """Simple version comparison. Returns >0 if v1 > v2, <0 if v1 < v2, 0 if equal."""
         if v1 == v2:
             return 0
-
-        import re
-        parts1 = re.split(r'[.\-]', v1)
-        parts2 = re.split(r'[.\-]', v2)
-
-        min_length = min(len(parts1), len(parts2))
-        for i in range(min_length):
-            part1 = parts1[i]
-            part2 = parts2[i]
-
-            try:
-                num1 = int(part1)
-                num2 = int(part2)
-                if num1 != num2:
-                    return num1 - num2
-            except ValueError:
-                if part1 != part2:
-                    return 1 if part1 > part2 else -1
-
-        return len(parts1) - len(parts2)
+        return _compare_version_strings(v1, v2)
 
     def _propagate_excluded_scopes(self) -> None:
         """
@@ -986,64 +962,78 @@ class DependencyGraphBuilder:
 
         logger.info("=== Propagating Maven scopes to transitive dependencies ===")
 
-        # Track which packages are reachable from each scope type
-        test_reachable: Set[str] = set()      # Reachable from test/provided/system roots
-        required_reachable: Set[str] = set()  # Reachable from compile/runtime/None roots
+        # Track which packages are reachable from each scope type, as a bitmask per package:
+        # _REQUIRED_REACHABLE from compile/runtime/None roots, _TEST_REACHABLE from
+        # test/provided/system roots. One shared walk visits each node at most once per bit.
+        # Registered nodes are flagged in a byte per node index; the rare node that was
+        # never registered in all_nodes falls back to a dict keyed by name.
+        reachable = bytearray(len(self.all_nodes))
+        unregistered: Dict[str, int] = {}
+        get_node = self.all_nodes.get
+        stack: List[Tuple[DependencyNode, int]] = []
 
-        # Walk dependency tree from each root to build reachability sets
         for root in self.root_nodes:
             root_scope = root.package.scope or 'required'
 
             # Determine if this root is test-scoped or required-scoped
             if root_scope in ('test', 'provided', 'system', 'excluded'):
-                # Track all packages reachable from test-scoped roots
-                self._collect_reachable_packages_by_scope(root, test_reachable)
-                logger.debug(f"Root {root.package.full_name} has scope '{root_scope}' - marking transitives as test-reachable")
+                stack.append((root, _TEST_REACHABLE))
+                logger.debug(f"Root {root.full_name} has scope '{root_scope}' - marking transitives as test-reachable")
+            else:
+                stack.append((root, _REQUIRED_REACHABLE))
+                logger.debug(f"Root {root.full_name} has scope '{root_scope}' - marking transitives as required-reachable")
+
+        while stack:
+            node, bit = stack.pop()
+            index = node.index
+            if index < 0:
+                registered = get_node(node.full_name)
+                index = registered.index if registered else -1
+
+            if index >= 0:
+                if reachable[index] & bit:
+                    continue
+                reachable[index] |= bit
             else:
-                # Track all packages reachable from required-scoped roots
-                self._collect_reachable_packages_by_scope(root, required_reachable)
-                logger.debug(f"Root {root.package.full_name} has scope '{root_scope}' - marking transitives as required-reachable")
+                flags = unregistered.get(node.full_name, 0)
+                if flags & bit:
+                    continue
+                unregistered[node.full_name] = flags | bit
+
+            for child in node.children:
+                stack.append((child, bit))
 
         # Apply scope propagation with override rule
+        debug = logger.isEnabledFor(logging.DEBUG)
         propagated_count = 0
-        for pkg_name in test_reachable:
+        test_count = 0
+        required_count = 0
+        flagged = [(node, flags) for node, flags in zip(self.all_nodes.values(), reachable) if flags]
+        flagged.extend((None, flags) for flags in unregistered.values())
+        for node, flags in flagged:
+            if flags & _REQUIRED_REACHABLE:
+                required_count += 1
+            if not flags & _TEST_REACHABLE:
+                continue
+            test_count += 1
+
             # Skip if also reachable from required path (required overrides test)
-            if pkg_name in required_reachable:
-                logger.debug(f"Package {pkg_name} reachable from both test and required paths - keeping as required")
+            if flags & _REQUIRED_REACHABLE:
+                if debug and node:
+                    logger.debug(f"Package {node.full_name} reachable from both test and required paths - keeping as required")
                 continue
 
             # Mark as excluded since only reachable from test/provided/system paths
-            node = self.all_nodes.get(pkg_name)
             if node and node.package.scope not in ('excluded',):
                 old_scope = node.package.scope
                 node.package.scope = 'excluded'
                 node.package.scope_reason = 'test-dependency'
                 propagated_count += 1
-                logger.debug(f"Propagated test scope to {pkg_name} (was '{old_scope}')")
+                if debug:
+                    logger.debug(f"Propagated test scope to {node.full_name} (was '{old_scope}')")
 
         logger.info(f"Scope propagation complete: {propagated_count} packages marked as test dependencies")
-        logger.info(f"Reachability stats: {len(test_reachable)} test-reachable, {len(required_reachable)} required-reachable")
-
-    def _collect_reachable_packages_by_scope(
-        self, node: DependencyNode, reachable: Set[str], visited: Optional[Set[str]] = None
-    ) -> None:
-        """
-        Collect all packages reachable from this node.
-        Used for scope propagation to track test vs required reachability.
-        """
-        if visited is None:
-            visited = set()
-
-        pkg_name = node.package.full_name
-        if pkg_name in visited:
-            return
-
-        visited.add(pkg_name)
-        reachable.add(pkg_name)
-
-        # Recursively collect children
-        for child in node.children:
-            self._collect_reachable_packages_by_scope(child, reachable, visited)
+        logger.info(f"Reachability stats: {test_count} test-reachable, {required_count} required-reachable")
 
     def get_all_reconciled_packages(self) -> Collection[Package]:
         """
@@ -1058,33 +1048,6 @@ class DependencyGraphBuilder:
 
         return packages
 
-    def _collect_packages_from_tree(
-        self, node: DependencyNode, package_map: Dict[str, Package],
-        visited: Optional[Set[str]] = None
-    ) -> None:
-        """Recursively collect packages from tree."""
-        if not node:
-            return
-
-        if visited is None:
-            visited = set()
-
-        pkg = node.package
-        base_key = f"{pkg.system}:{pkg.name}"
-        node_id = f"{base_key}:{pkg.version}"
-
-        # Prevent cycles
-        if node_id in visited:
-            return
-        visited.add(node_id)
-
-        # Just add if not present (after resolution, should all be winning versions)
-        if base_key not in package_map:
-            package_map[base_key] = pkg
-
-        for child in node.children:
-            self._collect_packages_from_tree(child, package_map, visited)
-
     def close(self):
         """Close resources."""
         self.api_client.close()
@@ -1,7 +1,9 @@
 """Core data models for deptrast."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from functools import cached_property
+from typing import AbstractSet, List, Optional, Dict, Set
 
 
 @dataclass
@@ -19,22 +21,46 @@ class Package:
     defeated_versions: List[str] = field(default_factory=list)  # If this is a winner, list of versions it defeated
     is_override_winner: bool = False  # True if this won via dependency management override
     version_metadata: Optional[Dict[str, str]] = None  # Metadata about version (e.g., HeroDevs info)
+    _defeated_versions_set: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Normalize system to lowercase."""
-        self.system = self.system.lower()
+        # Intern the identifying strings: the same system/name recurs across many versions
+        # and graphs, so this shares one copy and speeds up the many key comparisons
+        self.system = sys.intern(self.system.lower())
+        self.name = sys.intern(self.name)
         # Default to compile if scope is None or empty
         if not self.scope:
             self.scope = "compile"
         # Capture original scope if not already set
         if self.original_maven_scope is None:
             self.original_maven_scope = self.scope
+        self._defeated_versions_set = set(self.defeated_versions)
 
-    @property
+    @cached_property
     def full_name(self) -> str:
-        """Return the full package name in system:name:version format."""
+        """Return the full package name in system:name:version format, computed once per package."""
         return f"{self.system}:{self.name}:{self.version}"
 
+    def add_defeated_version(self, version: str) -> None:
+        """Record a version this package defeated (ignores duplicates, keeps order)."""
+        if version not in self._defeated_versions_set:
+            self._defeated_versions_set.add(version)
+            self.defeated_versions.append(version)
+
+    @cached_property
+    def base_key(self) -> str:
+        """Return the version-less key (system:name) used to group versions of a library."""
+        return f"{self.system}:{self.name}"
+
+    @cached_property
+    def purl(self) -> str:
+        """Return the Package URL (purl) string, computed once per package."""
+        if self.system == 'maven':
+            # Convert groupId:artifactId to groupId/artifactId
+            return f"pkg:maven/{self.name.replace(':', '/')}@{self.version}"
+        return f"pkg:{self.system}/{self.name}@{self.version}"
+
     def __str__(self) -> str:
         return self.full_name
 
@@ -54,6 +80,19 @@ class DependencyNode:
     package: Package
     is_root: bool = False
     children: List['DependencyNode'] = field(default_factory=list, compare=False, hash=False)
+    # id() of every node in children, for O(1) duplicate checks (nodes compare by identity)
+    # (leaves share one empty frozenset; the real set is allocated on the first add_child)
+    _child_ids: AbstractSet[int] = field(default=frozenset(), init=False, repr=False, compare=False, hash=False)
+    # package.full_name, materialized once since traversals read it on every visit
+    full_name: str = field(default="", init=False, repr=False, compare=False, hash=False)
+    # Dense integer id assigned by the graph builder when the node is registered (-1 if not)
+    index: int = field(default=-1, init=False, repr=False, compare=False, hash=False)
+
+    def __post_init__(self):
+        """Index any children passed to the constructor and cache the package name."""
+        if self.children:
+            self._child_ids = {id(child) for child in self.children}
+        self.full_name = self.package.full_name
 
     def __eq__(self, other) -> bool:
         """Equality based on object identity for graph node sharing."""
@@ -65,67 +104,93 @@ class DependencyNode:
 
     def add_child(self, child: 'DependencyNode') -> None:
         """Add a child dependency to this node."""
-        # DEBUG: Track commons-io additions to commons-compress
-        if "commons-compress@1.27.1" in self.package.full_name and "commons-io@2.19.0" in child.package.full_name:
-            import traceback
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"DEBUG: add_child() - Adding commons-io@2.19.0 to commons-compress@1.27.1")
-            logger.warning(f"DEBUG: Stack trace:\n{''.join(traceback.format_stack())}")
-        if child not in self.children:  # Avoid duplicates
+        child_ids = self._child_ids
+        if id(child) not in child_ids:  # Avoid duplicates
+            if not child_ids:
+                # First child: swap the shared empty placeholder for this node's own set
+                child_ids = self._child_ids = set()
+            child_ids.add(id(child))
             self.children.append(child)
 
+    def has_child(self, child: 'DependencyNode') -> bool:
+        """Check whether child is already a direct child of this node."""
+        return id(child) in self._child_ids
+
     def mark_as_root(self) -> None:
         """Mark this node as a root dependency."""
         self.is_root = True
 
     def get_tree_representation(self, prefix: str = "", is_last: bool = True, depth: int = 0, visited: set = None) -> str:
-        """Generate a tree visualization string (depth computed on-the-fly)."""
-        if visited is None:
-            visited = set()
+        """
+        Generate a tree visualization string (iterative pre-order walk; depth computed on-the-fly).
+
+        Each node's subtree is printed once. A node already on the current path (a real cycle)
+        is marked "(cycle)"; a shared node printed earlier elsewhere in the tree is marked
+        "(shared, see above)". Neither is expanded again. visited optionally names ancestors
+        already on the path above this node; the caller's set is copied, not modified.
+        """
+        visited = set(visited) if visited else set()  # names on the current path
+        seen = set(visited)
 
         lines = []
+        # Entries are (node, prefix, is_last, depth); a bare name marks leaving that node's subtree
+        stack = [(self, prefix, is_last, depth)]
+
+        while stack:
+            entry = stack.pop()
+            if isinstance(entry, str):
+                visited.discard(entry)
+                continue
+
+            node, prefix, is_last, depth = entry
+            node_id = node.full_name
 
-        # Check for cycles
-        node_id = self.package.full_name
-        if node_id in visited:
             # Root indicator
-            root_marker = "🔴 " if self.is_root else ""
+            root_marker = "🔴 " if node.is_root else ""
+
+            # Check for cycles, then for subtrees already printed
+            if node_id in visited:
+                cycle_marker = " (cycle)"
+            elif node_id in seen:
+                cycle_marker = " (shared, see above)"
+            else:
+                cycle_marker = ""
 
-            # Show cycle marker
+            # Current node
             connector = "└── " if is_last else "├── "
             if depth == 0:
-                lines.append(f"{root_marker}{node_id} (cycle)")
+                lines.append(f"{root_marker}{node_id}{cycle_marker}")
             else:
-                lines.append(f"{prefix}{connector}{root_marker}{node_id} (cycle)")
-            return "\n".join(lines)
-
-        visited.add(node_id)
-
-        # Root indicator
-        root_marker = "🔴 " if self.is_root else ""
+                lines.append(f"{prefix}{connector}{root_marker}{node_id}{cycle_marker}")
 
-        # Current node
-        connector = "└── " if is_last else "├── "
-        if depth == 0:
-            lines.append(f"{root_marker}{self.package.full_name}")
-        else:
-            lines.append(f"{prefix}{connector}{root_marker}{self.package.full_name}")
+            if cycle_marker:
+                continue
+            visited.add(node_id)
+            seen.add(node_id)
+            stack.append(node_id)
 
-        # Children
-        for i, child in enumerate(self.children):
-            is_last_child = (i == len(self.children) - 1)
+            # Children, pushed last-first so they are emitted in order
             if depth == 0:
                 child_prefix = ""
             else:
                 child_prefix = prefix + ("    " if is_last else "│   ")
-            lines.append(child.get_tree_representation(child_prefix, is_last_child, depth + 1, visited))
+            children = node.children
+            last_index = len(children) - 1
+            for i in range(last_index, -1, -1):
+                stack.append((children[i], child_prefix, i == last_index, depth + 1))
 
         return "\n".join(lines)
 
     def collect_all_packages(self) -> List[Package]:
-        """Recursively collect all packages in this tree."""
-        packages = [self.package]
-        for child in self.children:
-            packages.extend(child.collect_all_packages())
+        """Collect all packages in this tree, in pre-order (iterative; shared nodes and cycles visited once)."""
+        packages = []
+        visited = set()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            packages.append(node.package)
+            stack.extend(reversed(node.children))
         return packages
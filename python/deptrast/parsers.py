@@ -715,7 +715,7 @@ class FileParser:
 
                     pkg = _create_package_with_metadata(system='maven', name=name, version=version, scope=effective_scope)
                     packages.append(pkg)
-                    pkg_name = f"{pkg.system}:{pkg.name}:{pkg.version}"
+                    pkg_name = pkg.full_name
                     logger.info(f"Added package from pom.xml: {pkg_name} (scope: {effective_scope})")
 
                     # Store exclusions
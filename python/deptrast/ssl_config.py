@@ -10,10 +10,11 @@ This module provides a configured requests session that works with such proxies.
 import os
 import ssl
 import logging
-from typing import Optional
+from typing import Optional, Union
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib3.util.ssl_ import create_urllib3_context
 
 logger = logging.getLogger(__name__)
@@ -62,21 +63,37 @@ class CorporateSSLAdapter(HTTPAdapter):
         return super().init_poolmanager(*args, **kwargs)
 
 
-def create_session() -> requests.Session:
+def create_session(
+    pool_maxsize: Optional[int] = None,
+    max_retries: Optional[Union[int, Retry]] = None
+) -> requests.Session:
     """Create a requests session configured for corporate SSL environments.
 
+    Args:
+        pool_maxsize: Optional number of keep-alive connections to keep per host.
+            Set this to at least the number of threads sharing the session, otherwise
+            connections beyond the pool size are closed after each request.
+        max_retries: Optional urllib3 retry policy (or retry count) for HTTPS requests.
+
     Returns:
         A requests.Session that works with corporate SSL inspection proxies.
     """
     session = requests.Session()
+    adapter_kwargs = {}
+    if pool_maxsize:
+        adapter_kwargs['pool_maxsize'] = pool_maxsize
+    if max_retries is not None:
+        adapter_kwargs['max_retries'] = max_retries
 
     # Check if we're in a corporate SSL inspection environment
     cert_path = get_corporate_cert_path()
 
     if cert_path:
         logger.info(f"Detected corporate SSL environment, using {cert_path}")
-        adapter = CorporateSSLAdapter(cert_path=cert_path)
+        adapter = CorporateSSLAdapter(cert_path=cert_path, **adapter_kwargs)
         session.mount('https://', adapter)
+    elif adapter_kwargs:
+        session.mount('https://', HTTPAdapter(**adapter_kwargs))
 
     return session
 
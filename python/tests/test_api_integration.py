@@ -1,8 +1,15 @@
 """Integration tests for API client with version parsing."""
 
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
 import pytest
 from unittest.mock import Mock, patch
 from deptrast.api_client import DepsDevClient
+from deptrast.graph_builder import DependencyGraphBuilder
 from deptrast.models import Package
 
 
@@ -103,3 +110,143 @@ class TestDepsDevClientIntegration:
         assert "2.7.18:dependencies" in url
         assert "2.7.27" not in url
         assert result is not None
+
+    @patch('deptrast.api_client.requests.Session')
+    def test_repeated_lookups_are_cached(self, mock_session_class, tmp_path):
+        """Test that repeated lookups hit the in-memory cache and the disk cache survives a new client."""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'nodes': [], 'edges': []}
+        mock_session.get.return_value = mock_response
+        mock_session_class.return_value = mock_session
+
+        package = Package(system="maven", name="org.slf4j:slf4j-api", version="2.0.9")
+
+        client = DepsDevClient(cache_dir=str(tmp_path))
+        first = client.get_dependency_graph(package)
+        second = client.get_dependency_graph(package)
+
+        assert first == second == {'nodes': [], 'edges': []}
+        mock_session.get.assert_called_once()
+
+        # A fresh client reads the response back from disk without calling the API
+        mock_session.get.reset_mock()
+        assert DepsDevClient(cache_dir=str(tmp_path)).get_dependency_graph(package) == first
+        mock_session.get.assert_not_called()
+
+
+    @pytest.mark.parametrize('workers, pool_size', [(2, DepsDevClient.MAX_CONNECTIONS), (64, 64)])
+    def test_connection_pool_covers_fetch_workers(self, workers, pool_size):
+        """Test that the session pool holds at least one connection per fetch worker."""
+        with patch('deptrast.api_client.create_session') as create_session:
+            DependencyGraphBuilder(fetch_workers=workers)
+
+        create_session.assert_called_once()
+        assert create_session.call_args.kwargs['pool_maxsize'] == pool_size
+
+    @patch('deptrast.api_client.requests.Session')
+    def test_expired_disk_cache_is_refetched(self, mock_session_class, tmp_path):
+        """Test that a disk-cached response older than cache_ttl is fetched again and rewritten."""
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'nodes': [], 'edges': []}
+        mock_session.get.return_value = mock_response
+        mock_session_class.return_value = mock_session
+
+        package = Package(system="npm", name="lodash", version="4.17.21")
+        DepsDevClient(cache_dir=str(tmp_path), cache_ttl=3600).get_dependency_graph(package)
+        (cache_file,) = tmp_path.rglob('*.json')
+
+        # Still fresh: served from disk
+        mock_session.get.reset_mock()
+        DepsDevClient(cache_dir=str(tmp_path), cache_ttl=3600).get_dependency_graph(package)
+        mock_session.get.assert_not_called()
+
+        # Two hours old: stale, so deps.dev is asked again and the file is refreshed
+        stale = time.time() - 7200
+        os.utime(cache_file, (stale, stale))
+        mock_response.json.return_value = {'nodes': [{'relation': 'SELF'}], 'edges': []}
+        graph = DepsDevClient(cache_dir=str(tmp_path), cache_ttl=3600).get_dependency_graph(package)
+
+        mock_session.get.assert_called_once()
+        assert graph == {'nodes': [{'relation': 'SELF'}], 'edges': []}
+        assert cache_file.stat().st_mtime > stale
+        assert json.loads(cache_file.read_text()) == graph
+
+@pytest.fixture
+def depsdev_server():
+    """Serve a scripted list of HTTP status codes on localhost; yields (base_url, statuses, requests_seen)."""
+    statuses = []
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen.append(self.path)
+            status = statuses.pop(0) if statuses else 200
+            body = json.dumps({'nodes': [], 'edges': []} if status == 200 else {}).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/v3/systems", statuses, seen
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _local_client(base_url):
+    """A client whose deps.dev adapter (retry policy without backoff sleeps) also serves http://."""
+    client = DepsDevClient()
+    adapter = client.session.get_adapter(DepsDevClient.BASE_URL)
+    adapter.max_retries = adapter.max_retries.new(backoff_factor=0)
+    client.session.mount('http://', adapter)
+    client.BASE_URL = base_url
+    return client
+
+
+class TestDepsDevClientRetries:
+    """Tests for retrying transient deps.dev failures."""
+
+    def test_adapter_retry_policy(self):
+        """Test that the mounted adapter retries throttling and server errors with backoff."""
+        client = DepsDevClient()
+        retries = client.session.get_adapter(DepsDevClient.BASE_URL).max_retries
+
+        assert retries.total == 3
+        assert retries.backoff_factor == 0.5
+        assert set(retries.status_forcelist) == {429, 500, 502, 503, 504}
+        assert retries.raise_on_status is False
+        assert retries.respect_retry_after_header
+
+    def test_retries_until_success(self, depsdev_server):
+        """Test that a 503 followed by a 200 returns the graph."""
+        base_url, statuses, seen = depsdev_server
+        statuses.extend([503, 200])
+
+        client = _local_client(base_url)
+        graph = client.get_dependency_graph(Package(system="maven", name="org.slf4j:slf4j-api", version="2.0.9"))
+
+        assert graph == {'nodes': [], 'edges': []}
+        assert len(seen) == 2
+
+    def test_exhausted_retries_return_none(self, depsdev_server):
+        """Test that persistent 503s give up after the retry budget and return None."""
+        base_url, statuses, seen = depsdev_server
+        statuses.extend([503] * 10)
+
+        client = _local_client(base_url)
+        graph = client.get_dependency_graph(Package(system="maven", name="org.slf4j:slf4j-api", version="2.0.9"))
+
+        assert graph is None
+        assert len(seen) == 1 + DepsDevClient.MAX_RETRIES
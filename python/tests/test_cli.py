@@ -0,0 +1,98 @@
+"""Tests for command line argument parsing."""
+
+import json
+
+import pytest
+
+from deptrast.__main__ import build_parser, parse_dependency_graph_from_sbom
+from deptrast.api_client import DEFAULT_CACHE_TTL
+from deptrast.graph_builder import DEFAULT_FETCH_WORKERS
+from deptrast.models import Package
+
+
+class TestCreateArguments:
+    """Tests for the 'create' subcommand options."""
+
+    def test_cache_dir_does_not_consume_input(self):
+        """Test that --cache-dir takes its own value and leaves the positional input alone."""
+        args = build_parser().parse_args(['create', '--cache-dir', '/tmp/depsdev', 'deps.txt', 'out.json'])
+
+        assert args.cache_dir == '/tmp/depsdev'
+        assert args.input == 'deps.txt'
+        assert args.output == 'out.json'
+
+    def test_cache_flag_uses_default_location(self):
+        """Test that --cache is a plain switch before the positional input."""
+        args = build_parser().parse_args(['create', '--cache', 'deps.txt'])
+
+        assert args.cache
+        assert args.cache_dir is None
+        assert args.input == 'deps.txt'
+
+    def test_cache_dir_requires_value(self, capsys):
+        """Test that --cache-dir without a directory is a usage error."""
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(['create', 'deps.txt', '--cache-dir'])
+
+        assert '--cache-dir' in capsys.readouterr().err
+
+    def test_cache_ttl(self):
+        """Test that --cache-ttl takes hours and defaults to DEFAULT_CACHE_TTL."""
+        parser = build_parser()
+
+        assert parser.parse_args(['create', 'deps.txt']).cache_ttl * 3600 == DEFAULT_CACHE_TTL
+        assert parser.parse_args(['create', 'deps.txt', '--cache', '--cache-ttl', '2']).cache_ttl == 2
+
+    def test_parallel_fetches_default(self):
+        """Test that --parallel-fetches defaults to DEFAULT_FETCH_WORKERS."""
+        args = build_parser().parse_args(['create', 'deps.txt'])
+
+        assert args.parallel_fetches == DEFAULT_FETCH_WORKERS
+
+    def test_parallel_fetches_value(self):
+        """Test that --parallel-fetches accepts a positive count."""
+        args = build_parser().parse_args(['create', 'deps.txt', '--parallel-fetches', '64'])
+
+        assert args.parallel_fetches == 64
+
+    @pytest.mark.parametrize('value', ['0', '-2', 'many'])
+    def test_parallel_fetches_rejects_invalid(self, value, capsys):
+        """Test that --parallel-fetches below 1 or not a number is a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            build_parser().parse_args(['create', 'deps.txt', '--parallel-fetches', value])
+
+        assert exc_info.value.code == 2
+        assert '--parallel-fetches' in capsys.readouterr().err
+
+
+class TestExistingDependencyGraph:
+    """Tests for reusing the dependencies array of an input SBOM (--use-existing-deps)."""
+
+    def test_parse_dependency_graph_from_sbom(self):
+        """Test that roots come from the project ref and children follow dependsOn, sharing nodes."""
+        names = ("app", "core", "util", "tool")
+        packages = [Package(system="maven", name=f"com.example:{name}", version="1.0") for name in names]
+        refs = {name: f"pkg:maven/com.example/{name}@1.0" for name in names}
+        sbom = {
+            'bomFormat': 'CycloneDX',
+            'metadata': {'component': {'bom-ref': 'project'}},
+            'components': [{'bom-ref': ref, 'purl': ref} for ref in refs.values()],
+            'dependencies': [
+                {'ref': 'project', 'dependsOn': [refs['app'], refs['tool']]},
+                {'ref': refs['app'], 'dependsOn': [refs['core'], refs['util']]},
+                {'ref': refs['core'], 'dependsOn': [refs['util']]},
+                {'ref': refs['util'], 'dependsOn': []},
+                {'ref': refs['tool'], 'dependsOn': []},
+            ],
+        }
+
+        trees = parse_dependency_graph_from_sbom(json.dumps(sbom), packages)
+
+        roots = {tree.package.name: tree for tree in trees}
+        assert sorted(roots) == ['com.example:app', 'com.example:tool']
+        app = roots['com.example:app']
+        assert [c.package.name for c in app.children] == ['com.example:core', 'com.example:util']
+        core, util = app.children
+        assert len(core.children) == 1 and core.children[0] is util
+        assert util.children == []
+        assert roots['com.example:tool'].children == []
@@ -0,0 +1,124 @@
+"""Tests for output formatters."""
+
+import io
+import json
+import re
+
+from deptrast.formatters import OutputFormatter
+from deptrast.models import Package, DependencyNode
+
+
+def _sample_graph():
+    """Build a small graph: app -> (core, util), core -> util, plus an empty-deps leaf."""
+    app = DependencyNode(package=Package(system="maven", name="com.example:app", version="1.0.0"))
+    core = DependencyNode(package=Package(system="maven", name="com.example:core", version="2.1.0"))
+    util = DependencyNode(package=Package(system="maven", name="com.example:util", version="3.0.0",
+                                          scope="test"))
+    app.add_child(core)
+    app.add_child(util)
+    core.add_child(util)
+    app.mark_as_root()
+    packages = [app.package, core.package, util.package]
+    return packages, [app]
+
+
+def _normalize(sbom_json: str) -> str:
+    """Blank out the per-run serial number and timestamp."""
+    sbom_json = re.sub(r'"serialNumber" : "[^"]*"', '"serialNumber" : "X"', sbom_json)
+    return re.sub(r'"timestamp" : "[^"]*"', '"timestamp" : "X"', sbom_json)
+
+
+class TestSbomOutput:
+    """Tests for CycloneDX SBOM generation."""
+
+    def test_sbom_dependencies(self):
+        """Test that dependsOn lists only known packages, sorted by purl."""
+        packages, trees = _sample_graph()
+        sbom = json.loads(OutputFormatter.format_as_sbom(packages, trees))
+
+        deps = {d['ref']: d['dependsOn'] for d in sbom['dependencies']}
+        assert deps['pkg:maven/com.example/app@1.0.0'] == [
+            'pkg:maven/com.example/core@2.1.0',
+            'pkg:maven/com.example/util@3.0.0',
+        ]
+        assert deps['pkg:maven/com.example/core@2.1.0'] == ['pkg:maven/com.example/util@3.0.0']
+        assert deps['pkg:maven/com.example/util@3.0.0'] == []
+
+    def test_sbom_component_field_order(self):
+        """Test that component fields follow the Java field order."""
+        packages, trees = _sample_graph()
+        sbom = json.loads(OutputFormatter.format_as_sbom(packages, trees))
+
+        util = next(c for c in sbom['components'] if c['name'] == 'util')
+        assert list(util.keys()) == ['type', 'bom-ref', 'group', 'name', 'version', 'scope',
+                                     'purl', 'properties', 'tags']
+        assert util['scope'] == 'excluded'
+
+    def test_dump_sbom_matches_format_as_sbom(self):
+        """Test that streaming a built SBOM produces the same document as format_as_sbom."""
+        packages, trees = _sample_graph()
+        expected = OutputFormatter.format_as_sbom(packages, trees, "deptrast create in out")
+
+        buffer = io.StringIO()
+        OutputFormatter.dump_sbom(buffer, OutputFormatter.build_sbom(packages, trees, "deptrast create in out"))
+
+        assert '[ ]' in buffer.getvalue()
+        assert _normalize(buffer.getvalue()) == _normalize(expected)
+
+    def test_dump_sbom_without_java_compat(self):
+        """Test that java_compat=False writes standard JSON formatting."""
+        packages, trees = _sample_graph()
+
+        buffer = io.StringIO()
+        OutputFormatter.dump_sbom(buffer, OutputFormatter.build_sbom(packages, trees), java_compat=False)
+
+        output = buffer.getvalue()
+        assert '"bomFormat": "CycloneDX"' in output
+        assert '[ ]' not in output
+        assert len(json.loads(output)['components']) == 3
+
+
+class TestTreeOutput:
+    """Tests for tree visualizations."""
+
+    def test_maven_tree(self):
+        """Test Maven tree layout; a node already printed is shown once more as shared."""
+        _, trees = _sample_graph()
+
+        assert OutputFormatter.format_as_maven_tree("proj", trees).splitlines() == [
+            "[INFO] proj",
+            "[INFO] +- maven:com.example:app:1.0.0",
+            "[INFO]    +- maven:com.example:core:2.1.0",
+            "[INFO]    |  \\- maven:com.example:util:3.0.0",
+            "[INFO]    \\- maven:com.example:util:3.0.0 (shared, see above)",
+        ]
+
+    def test_maven_tree_marks_cycles(self):
+        """Test that only a node already on the current path is marked as a cycle."""
+        _, trees = _sample_graph()
+        app = trees[0]
+        util = app.children[1]
+        util.add_child(app)
+
+        assert OutputFormatter.format_as_maven_tree("proj", trees).splitlines() == [
+            "[INFO] proj",
+            "[INFO] +- maven:com.example:app:1.0.0",
+            "[INFO]    +- maven:com.example:core:2.1.0",
+            "[INFO]    |  \\- maven:com.example:util:3.0.0",
+            "[INFO]    |     \\- maven:com.example:app:1.0.0 (cycle)",
+            "[INFO]    \\- maven:com.example:util:3.0.0 (shared, see above)",
+        ]
+
+    def test_tree_marks_shared_nodes(self):
+        """Test that a shared package is printed once and then marked as shared, not as a cycle."""
+        packages, trees = _sample_graph()
+
+        lines = OutputFormatter.format_as_tree(trees, packages, "proj").splitlines()
+
+        assert lines[2:7] == [
+            "project:proj:1.0.0",
+            "└── 🔴 maven:com.example:app:1.0.0",
+            "    ├── maven:com.example:core:2.1.0",
+            "    │   └── maven:com.example:util:3.0.0",
+            "    └── maven:com.example:util:3.0.0 (shared, see above)",
+        ]
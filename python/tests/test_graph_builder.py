@@ -0,0 +1,179 @@
+"""Tests for the dependency graph builder (deps.dev responses are mocked)."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from deptrast.graph_builder import DependencyGraphBuilder
+from deptrast.models import Package
+
+
+def _graph(*nodes, edges=()):
+    """Build a deps.dev style :dependencies response. The first node is SELF."""
+    return {
+        'nodes': [
+            {
+                'versionKey': {'system': 'MAVEN', 'name': name, 'version': version},
+                'relation': 'SELF' if i == 0 else 'INDIRECT',
+            }
+            for i, (name, version) in enumerate(nodes)
+        ],
+        'edges': [{'fromNode': a, 'toNode': b, 'requirement': ''} for a, b in edges],
+    }
+
+
+# app:1.0 -> lib-a:1.0 -> lib-c:1.0
+#         -> lib-b:1.0 -> lib-c:2.0
+GRAPHS = {
+    'com.example:app:1.0': _graph(
+        ('com.example:app', '1.0'), ('com.example:lib-a', '1.0'),
+        ('com.example:lib-b', '1.0'), ('com.example:lib-c', '1.0'), ('com.example:lib-c', '2.0'),
+        edges=[(0, 1), (0, 2), (1, 3), (2, 4)],
+    ),
+    'com.example:lib-a:1.0': _graph(
+        ('com.example:lib-a', '1.0'), ('com.example:lib-c', '1.0'), edges=[(0, 1)],
+    ),
+    'com.example:lib-b:1.0': _graph(
+        ('com.example:lib-b', '1.0'), ('com.example:lib-c', '2.0'), edges=[(0, 1)],
+    ),
+    'com.example:lib-c:1.0': _graph(('com.example:lib-c', '1.0')),
+    'com.example:lib-c:2.0': _graph(('com.example:lib-c', '2.0')),
+}
+
+
+@pytest.fixture
+def fetched():
+    """Patch the deps.dev client to serve GRAPHS; yields the list of fetched packages."""
+    calls = []
+    lock = threading.Lock()
+
+    def fake_get(self, package):
+        with lock:
+            calls.append(package.full_name)
+        return GRAPHS.get(f"{package.name}:{package.version}")
+
+    with patch('deptrast.graph_builder.DepsDevClient.get_dependency_graph', fake_get):
+        yield calls
+
+
+def _maven(name, version, scope='compile'):
+    return Package(system='maven', name=name, version=version, scope=scope)
+
+
+class TestDependencyGraphBuilder:
+    """Tests for DependencyGraphBuilder."""
+
+    def test_build_finds_roots(self, fetched):
+        """Test that inputs appearing in another input's graph are not roots."""
+        inputs = [_maven('com.example:app', '1.0'), _maven('com.example:lib-a', '1.0')]
+
+        with DependencyGraphBuilder() as builder:
+            roots = builder.build_dependency_trees(inputs)
+
+        assert [r.package.full_name for r in roots] == ['maven:com.example:app:1.0']
+        assert roots[0].is_root
+        assert sorted(fetched) == ['maven:com.example:app:1.0', 'maven:com.example:lib-a:1.0']
+        assert len(builder.all_nodes) == 5
+        assert [n.package.version for n in builder.nodes_by_base_key['maven:com.example:lib-c']] == ['1.0', '2.0']
+
+    def test_concurrent_fetch_matches_serial(self, fetched):
+        """Test that fetching concurrently builds the same graph as fetching serially."""
+        inputs = [_maven('com.example:app', '1.0'), _maven('com.example:lib-a', '1.0'),
+                  _maven('com.example:lib-b', '1.0'), _maven('com.example:missing', '9.9')]
+
+        def build(workers):
+            with DependencyGraphBuilder() as builder:
+                builder.fetch_workers = workers
+                builder.build_dependency_trees(inputs)
+                return {name: [c.package.full_name for c in node.children]
+                        for name, node in builder.all_nodes.items()}
+
+        serial = build(1)
+        concurrent = build(4)
+
+        assert serial == concurrent
+        assert list(serial) == list(concurrent)  # same insertion order
+        assert serial['maven:com.example:missing:9.9'] == []
+
+    def test_duplicate_inputs_fetched_once(self, fetched):
+        """Test that a package listed twice only costs one deps.dev request."""
+        inputs = [_maven('com.example:lib-a', '1.0'), _maven('com.example:lib-b', '1.0'),
+                  _maven('com.example:lib-a', '1.0')]
+
+        with DependencyGraphBuilder() as builder:
+            with patch.object(builder, '_parse_dependency_graph',
+                              wraps=builder._parse_dependency_graph) as parse:
+                builder.build_dependency_trees(inputs)
+
+        assert sorted(fetched) == ['maven:com.example:lib-a:1.0', 'maven:com.example:lib-b:1.0']
+        assert parse.call_count == 2
+
+    def test_maven_conflict_resolution(self, fetched):
+        """Test Maven nearest-wins marks the deeper, losing version as excluded."""
+        inputs = [_maven('com.example:app', '1.0')]
+
+        with DependencyGraphBuilder() as builder:
+            builder.set_resolution_strategy('maven')
+            builder.build_dependency_trees(inputs)
+            builder.apply_conflict_resolution()
+
+        winner = builder.all_packages['maven:com.example:lib-c:2.0']
+        loser = builder.all_packages['maven:com.example:lib-c:1.0']
+        assert loser.scope == 'excluded'
+        assert loser.scope_reason == 'loser'
+        assert loser.winning_version == '2.0'
+        assert winner.defeated_versions == ['1.0']
+        assert winner.scope == 'compile'
+
+    @pytest.mark.parametrize('workers', [1, 4])
+    def test_managed_override_survives_failed_fetch(self, workers):
+        """Test that one managed version failing to fetch does not skip the other overrides."""
+        graphs = dict(GRAPHS)
+        graphs['com.example:lib-b:2.0'] = _graph(('com.example:lib-b', '2.0'))
+
+        def fake_get(self, package):
+            if package.full_name == 'maven:com.example:lib-a:9.0':
+                raise RuntimeError('connection reset')
+            return graphs.get(f"{package.name}:{package.version}")
+
+        with patch('deptrast.graph_builder.DepsDevClient.get_dependency_graph', fake_get):
+            with DependencyGraphBuilder(fetch_workers=workers) as builder:
+                builder.set_dependency_management({
+                    'maven:com.example:lib-a': '9.0',
+                    'maven:com.example:lib-b': '2.0',
+                })
+                builder.build_dependency_trees([_maven('com.example:app', '1.0')])
+
+        assert 'maven:com.example:lib-a:9.0' not in builder.all_nodes
+        assert builder.all_packages['maven:com.example:lib-a:1.0'].scope_reason is None
+        loser = builder.all_packages['maven:com.example:lib-b:1.0']
+        assert loser.scope_reason == 'override-loser'
+        assert loser.winning_version == '2.0'
+        assert builder.all_packages['maven:com.example:lib-b:2.0'].is_override_winner
+
+    def test_keys_are_package_full_names(self, fetched):
+        """Test that all_packages and all_nodes are keyed by the packages' own full_name strings."""
+        with DependencyGraphBuilder() as builder:
+            builder.set_dependency_management({'com.example:lib-c': '3.0'})
+            builder.build_dependency_trees([_maven('com.example:app', '1.0')])
+
+        assert 'maven:com.example:lib-c:3.0' in builder.all_packages
+        for key, pkg in builder.all_packages.items():
+            assert key is pkg.full_name
+        for key, node in builder.all_nodes.items():
+            assert key is node.package.full_name
+
+    def test_reused_builder_skips_managed_versions_in_graph(self, fetched):
+        """Test that a second build on the same builder does not refetch a managed version it already has."""
+        with DependencyGraphBuilder() as builder:
+            builder.set_dependency_management({'com.example:lib-c': '2.0'})
+            builder.build_dependency_trees([_maven('com.example:app', '1.0')])
+            managed = builder.all_packages['maven:com.example:lib-c:2.0']
+            assert sorted(fetched) == ['maven:com.example:app:1.0', 'maven:com.example:lib-c:2.0']
+
+            fetched.clear()
+            builder.build_dependency_trees([_maven('com.example:lib-a', '1.0')])
+
+        assert fetched == ['maven:com.example:lib-a:1.0']
+        assert builder.all_packages['maven:com.example:lib-c:2.0'] is managed
@@ -0,0 +1,138 @@
+"""Tests for core data models."""
+
+from deptrast.models import Package, DependencyNode
+
+
+class TestPackage:
+    """Tests for the Package class."""
+
+    def test_system_normalized(self):
+        """Test that system is lowercased and derived keys use it."""
+        pkg = Package(system="MAVEN", name="org.slf4j:slf4j-api", version="2.0.9")
+
+        assert pkg.system == "maven"
+        assert pkg.full_name == "maven:org.slf4j:slf4j-api:2.0.9"
+        assert pkg.base_key == "maven:org.slf4j:slf4j-api"
+
+    def test_purl(self):
+        """Test purl generation for Maven and non-Maven packages."""
+        maven = Package(system="maven", name="org.slf4j:slf4j-api", version="2.0.9")
+        npm = Package(system="NPM", name="lodash", version="4.17.21")
+
+        assert maven.purl == "pkg:maven/org.slf4j/slf4j-api@2.0.9"
+        assert npm.purl == "pkg:npm/lodash@4.17.21"
+
+    def test_add_defeated_version(self):
+        """Test that defeated versions are deduplicated and keep insertion order."""
+        pkg = Package(system="maven", name="com.example:lib", version="2.0", defeated_versions=["1.0"])
+
+        pkg.add_defeated_version("1.5")
+        pkg.add_defeated_version("1.0")
+        pkg.add_defeated_version("1.5")
+
+        assert pkg.defeated_versions == ["1.0", "1.5"]
+
+    def test_equality_by_full_name(self):
+        """Test that packages with the same coordinates are equal regardless of scope."""
+        a = Package(system="maven", name="com.example:lib", version="1.0", scope="test")
+        b = Package(system="Maven", name="com.example:lib", version="1.0")
+
+        assert a == b
+        assert hash(a) == hash(b)
+        assert len({a, b}) == 1
+
+
+class TestDependencyNode:
+    """Tests for the DependencyNode class."""
+
+    def test_add_child_ignores_duplicates(self):
+        """Test that the same child node is only added once."""
+        parent = DependencyNode(package=Package(system="maven", name="com.example:app", version="1.0"))
+        child = DependencyNode(package=Package(system="maven", name="com.example:lib", version="1.0"))
+
+        parent.add_child(child)
+        parent.add_child(child)
+
+        assert parent.children == [child]
+        assert parent.has_child(child)
+
+    def test_collect_all_packages(self):
+        """Test that packages are collected in pre-order, once per node, even with cycles."""
+        app = DependencyNode(package=Package(system="maven", name="com.example:app", version="1.0"))
+        core = DependencyNode(package=Package(system="maven", name="com.example:core", version="1.0"))
+        util = DependencyNode(package=Package(system="maven", name="com.example:util", version="1.0"))
+        app.add_child(core)
+        app.add_child(util)
+        core.add_child(util)
+        util.add_child(app)
+
+        assert [p.name for p in app.collect_all_packages()] == [
+            "com.example:app", "com.example:core", "com.example:util",
+        ]
+
+    def test_tree_representation(self):
+        """Test the tree layout; shared nodes are printed once, cycles are cut."""
+        app = DependencyNode(package=Package(system="maven", name="com.example:app", version="1.0"))
+        core = DependencyNode(package=Package(system="maven", name="com.example:core", version="1.0"))
+        util = DependencyNode(package=Package(system="maven", name="com.example:util", version="1.0"))
+        log = DependencyNode(package=Package(system="maven", name="com.example:log", version="1.0"))
+        app.add_child(core)
+        app.add_child(util)
+        core.add_child(util)
+        util.add_child(log)
+        log.add_child(util)
+        app.mark_as_root()
+
+        assert app.get_tree_representation().splitlines() == [
+            "🔴 maven:com.example:app:1.0",
+            "├── maven:com.example:core:1.0",
+            "│   └── maven:com.example:util:1.0",
+            "│       └── maven:com.example:log:1.0",
+            "│           └── maven:com.example:util:1.0 (cycle)",
+            "└── maven:com.example:util:1.0 (shared, see above)",
+        ]
+
+    def test_tree_representation_leaves_visited_unchanged(self):
+        """Test that a caller's visited set marks ancestors as cycles without being modified."""
+        app = DependencyNode(package=Package(system="maven", name="com.example:app", version="1.0"))
+        core = DependencyNode(package=Package(system="maven", name="com.example:core", version="1.0"))
+        core.add_child(app)
+        visited = {"maven:com.example:app:1.0"}
+
+        assert core.get_tree_representation(visited=visited).splitlines() == [
+            "maven:com.example:core:1.0",
+            "└── maven:com.example:app:1.0 (cycle)",
+        ]
+        assert visited == {"maven:com.example:app:1.0"}
+
+    def test_tree_representation_shared_diamonds_stay_linear(self):
+        """Test that stacked diamonds do not re-expand shared subtrees exponentially."""
+        top = node = DependencyNode(package=Package(system="maven", name="com.example:d0", version="1.0"))
+        for i in range(1, 30):
+            left = DependencyNode(package=Package(system="maven", name=f"com.example:l{i}", version="1.0"))
+            right = DependencyNode(package=Package(system="maven", name=f"com.example:r{i}", version="1.0"))
+            bottom = DependencyNode(package=Package(system="maven", name=f"com.example:d{i}", version="1.0"))
+            node.add_child(left)
+            node.add_child(right)
+            left.add_child(bottom)
+            right.add_child(bottom)
+            node = bottom
+
+        lines = top.get_tree_representation().splitlines()
+
+        assert len(lines) == 1 + 4 * 29
+        assert not any("(cycle)" in line for line in lines)
+        assert sum("(shared, see above)" in line for line in lines) == 29
+
+    def test_tree_representation_deep_chain(self):
+        """Test that deep chains render without hitting the recursion limit."""
+        root = node = DependencyNode(package=Package(system="maven", name="com.example:lib0", version="1.0"))
+        for i in range(1, 3000):
+            child = DependencyNode(package=Package(system="maven", name=f"com.example:lib{i}", version="1.0"))
+            node.add_child(child)
+            node = child
+
+        lines = root.get_tree_representation().splitlines()
+
+        assert len(lines) == 3000
+        assert lines[-1].endswith("└── maven:com.example:lib2999:1.0")